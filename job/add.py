@@ -1,23 +1,36 @@
+import hashlib
 import json
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import typer
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 from rich.console import Console
 
 from job.core import AppContext, JobAd, JobAdBase
-from job.core.agents import create_agent
 from job.utils import error, handle_ai_errors, validate_url
-from job.fetchers import BrowserFetcher, StaticFetcher
-from job.fetchers.base import FetchResult
+from job.fetchers import BrowserFetcher
+from job.fetchers.base import MAX_CONTENT_CHARS, FetchResult
 
 console = Console()
 
+# Upper bound on concurrent static fetches in add-many
+MAX_FETCH_WORKERS = 8
+
 # Create sub-app for add commands
 app = typer.Typer()
 
 
-def fetch_job_text(url: str, ctx: AppContext, use_browser: bool = False) -> FetchResult:
+def fetch_job_text(
+    url: str,
+    ctx: AppContext,
+    use_browser: bool = False,
+    etag: str | None = None,
+    last_modified: str | None = None,
+    main_content: bool = False,
+) -> FetchResult:
     """Fetch job posting text with automatic fallback.
 
     Args:
@@ -25,6 +38,10 @@ def fetch_job_text(url: str, ctx: AppContext, use_browser: bool = False) -> Fetc
         ctx: Application context
         use_browser: If True, skip static fetch and use browser directly.
                      If False, try static first, fall back to browser on failure.
+        etag: Validator from a previous static fetch, for a conditional request
+        last_modified: Validator from a previous static fetch
+        main_content: If True, keep only the main content region of a static
+            fetch (for AI extraction)
 
     Returns:
         FetchResult containing text and title
@@ -41,13 +58,16 @@ def fetch_job_text(url: str, ctx: AppContext, use_browser: bool = False) -> Fetc
         return browser_fetcher.fetch(url)
 
     # Try static fetch first (fast)
-    static_fetcher = StaticFetcher(
-        timeout=ctx.config.REQUEST_TIMEOUT, logger=ctx.logger
-    )
+    static_fetcher = ctx.static_fetcher
     if ctx.config.verbose:
         console.log("[dim]Fetching with requests...[/dim]")
     try:
-        return static_fetcher.fetch(url)
+        return static_fetcher.fetch(
+            url,
+            etag=etag,
+            last_modified=last_modified,
+            main_content=main_content,
+        )
     except Exception as e:
         # Static fetch failed, retry with browser
         ctx.logger.debug("static_fetch_failed", error=str(e))
@@ -65,16 +85,25 @@ def extract_job_info(
     url: str, job_text: str, ctx: AppContext, model: str | None = None
 ) -> JobAdBase:
     """Extract job information using AI agent with error handling."""
+    # Deferred so commands that never extract don't import pydantic_ai
+    from job.core.agents import create_agent
+
     model_name = ctx.config.get_model(model)
     agent = create_agent(model_name, ctx.config.SYSTEM_PROMPT)
 
     with handle_ai_errors("extract job info"):
         result = agent.run_sync(
-            f"Extract job info from this posting.\nURL: {url}\n\nJob text:\n{job_text}"
+            "Extract job info from this posting.\n"
+            f"URL: {url}\n\nJob text:\n{job_text[:MAX_CONTENT_CHARS]}"
         )
         return result.output
 
 
+def _prompt_text_sha256(job_text: str) -> str:
+    """Hash the part of the job text that goes into the extraction prompt."""
+    return hashlib.sha256(job_text[:MAX_CONTENT_CHARS].encode()).hexdigest()
+
+
 def _build_job_data(
     url: str,
     fetch_result: FetchResult,
@@ -297,6 +326,9 @@ def add(
         "-b",
         help="Use browser automation to fetch the page (from config if not specified)",
     ),
+    force: bool = typer.Option(
+        False, "--force", help="Re-extract even if the page is unchanged"
+    ),
 ) -> None:
     """
     Add or update a job ad. (Alias: a)
@@ -307,6 +339,7 @@ def add(
     Use --browser to use a full browser (Playwright) for JS-heavy sites.
     Use --structured to extract structured fields (title, company, etc.) via AI.
     Use --from-issue to create a job from an existing GitHub issue.
+    Structured re-adds of an unchanged page skip the AI call (unless --force).
 
     Examples:
         job add https://example.com/job
@@ -332,6 +365,9 @@ def add(
     final_browser = browser if browser is not None else app_ctx.config.add.browser
     final_model = app_ctx.config.get_model(model or app_ctx.config.add.model)
 
+    # Only set for structured URL adds; other paths clear a stale hash
+    content_sha256 = None
+
     if from_issue:
         # Handle GitHub issue case
         # Use repo from CLI or fall back to config
@@ -342,40 +378,260 @@ def add(
             from_issue, final_structured, app_ctx, model=final_model, repo=final_repo
         )
         final_url = job_data["job_posting_url"]  # Extract URL from issue
+        job_data["etag"] = job_data["last_modified"] = None
     else:
         # Handle URL case
         final_url = validate_url(url)
         app_ctx.logger.debug(f"Processing URL: {final_url}")
 
-        # Fetch job content
+    # Check for existing entry (unique index on job_posting_url). Only the
+    # change-detection columns; the session is closed before the fetch and AI
+    # call so no connection or read transaction is held across them
+    with Session(app_ctx.engine) as session:
+        existing = session.exec(
+            select(JobAd.id, JobAd.content_sha256, JobAd.etag, JobAd.last_modified)
+            .where(JobAd.job_posting_url == final_url)
+            .limit(1)
+        ).first()
+    # Unpacked up front; a new job has none of these yet
+    row = existing or (None, None, None, None)
+    existing_id, stored_sha256, stored_etag, stored_last_modified = row
+
+    if not from_issue:
+        # Revalidate against the stored page only if it was extracted the
+        # same way, so a 304 can stand in for an unchanged hash
+        etag = last_modified = None
+        if existing and not force and bool(stored_sha256) == final_structured:
+            etag, last_modified = stored_etag, stored_last_modified
+
         with console.status("[bold dim]Fetching job page...[/bold dim]"):
-            fetch_result = fetch_job_text(final_url, app_ctx, use_browser=final_browser)
+            fetch_result = fetch_job_text(
+                final_url,
+                app_ctx,
+                use_browser=final_browser,
+                etag=etag,
+                last_modified=last_modified,
+                # Trimmed only for extraction; a plain add stores the full text
+                main_content=final_structured,
+            )
         app_ctx.logger.debug("job_text_fetched", chars=len(fetch_result.content))
 
+        if fetch_result.not_modified and existing:
+            typer.echo(
+                f"Job {existing_id} not modified since last fetch; "
+                "use --force to re-extract"
+            )
+            return
+
+        if final_structured:
+            content_sha256 = _prompt_text_sha256(fetch_result.content)
+
+        # Skip the AI call when the stored fields came from this exact text
+        if (
+            content_sha256
+            and not force
+            and existing
+            and stored_sha256 == content_sha256
+        ):
+            typer.echo(
+                f"Job {existing_id} unchanged since last fetch; "
+                "use --force to re-extract"
+            )
+            return
+
         job_data = _build_job_data(
             final_url, fetch_result, final_structured, app_ctx, model=final_model
         )
+        job_data["etag"] = fetch_result.etag
+        job_data["last_modified"] = fetch_result.last_modified
 
-    with Session(app_ctx.engine) as session:
-        # Check for existing entry
-        existing = session.exec(
-            select(JobAd).where(JobAd.job_posting_url == final_url)
-        ).first()
+    job_data["content_sha256"] = content_sha256
 
+    # Short write transaction. Nothing is server-generated beyond the id, so
+    # the object stays valid after commit and needs no refresh round trip
+    with Session(app_ctx.engine, expire_on_commit=False) as session:
         if existing:
             # Update existing entry
+            job = session.get_one(JobAd, existing_id)
             for key, value in job_data.items():
-                setattr(existing, key, value)
-            session.add(existing)
+                setattr(job, key, value)
+            session.add(job)
             session.commit()
-            session.refresh(existing)
             typer.echo("Job updated:")
-            typer.echo(existing.model_dump_json(indent=2))
+            typer.echo(job.model_dump_json(indent=2))
         else:
             # Create new entry
             job = JobAd.model_validate(job_data)
             session.add(job)
             session.commit()
-            session.refresh(job)
             typer.echo("Job saved:")
             typer.echo(job.model_dump_json(indent=2))
+
+
+def fetch_many(
+    urls: list[str], ctx: AppContext, use_browser: bool = False
+) -> list[FetchResult]:
+    """Fetch several job postings, overlapping the static requests.
+
+    Static fetches run concurrently. Browser fetches (forced, or as fallback
+    for failed static fetches) run one by one on the calling thread, since
+    Playwright's sync API is bound to the thread that started it.
+    """
+    results: list[FetchResult | None] = [None] * len(urls)
+
+    if not use_browser:
+        static_fetcher = ctx.static_fetcher
+
+        def try_static(url: str) -> FetchResult | None:
+            try:
+                return static_fetcher.fetch(url, main_content=True)
+            except Exception as e:
+                ctx.logger.debug("static_fetch_failed", url=url, error=str(e))
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(urls))) as pool:
+            results = list(pool.map(try_static, urls))
+
+    return [
+        result if result is not None else fetch_job_text(url, ctx, use_browser=True)
+        for url, result in zip(urls, results)
+    ]
+
+
+def extract_many_job_infos(
+    urls: list[str], job_texts: list[str], ctx: AppContext, model: str | None = None
+) -> list[JobAdBase]:
+    """Extract several job ads with a single AI call, in input order."""
+    from job.core.agents import create_batch_agent
+
+    model_name = ctx.config.get_model(model)
+    agent = create_batch_agent(model_name, ctx.config.SYSTEM_PROMPT)
+
+    sections = [
+        f"=== Job {i} ===\nURL: {url}\n\nJob text:\n{text[:MAX_CONTENT_CHARS]}\n"
+        for i, (url, text) in enumerate(zip(urls, job_texts), 1)
+    ]
+    prompt = (
+        f"Extract job info from each of these {len(urls)} postings. Return exactly "
+        "one entry per posting, in the same order.\n\n" + "\n".join(sections)
+    )
+
+    with handle_ai_errors("extract job info"):
+        result = agent.run_sync(prompt)
+
+    if len(result.output) != len(urls):
+        error(f"AI returned {len(result.output)} jobs for {len(urls)} postings")
+        raise typer.Exit(1)
+    return result.output
+
+
+@app.command(name="add-many")
+def add_many(
+    ctx: typer.Context,
+    urls_file: Path = typer.Argument(
+        ...,
+        exists=True,
+        dir_okay=False,
+        help="File with one job posting URL per line (# starts a comment)",
+    ),
+    model: str = typer.Option(
+        None, "--model", "-m", help="AI model to use (from config if not specified)"
+    ),
+    browser: bool = typer.Option(
+        None,
+        "--browser",
+        "-b",
+        help="Use browser automation to fetch the pages (from config if not specified)",
+    ),
+    force: bool = typer.Option(
+        False, "--force", help="Re-extract even if a page is unchanged"
+    ),
+) -> None:
+    """
+    Add or update several job ads with one AI extraction call.
+
+    Fetches all pages (static fetches run concurrently), then extracts the
+    structured fields of every changed page in a single model request.
+
+    Examples:
+        job add-many urls.txt
+        job add-many urls.txt -m openai:gpt-4o --force
+    """
+    app_ctx: AppContext = ctx.obj
+
+    lines = (line.strip() for line in urls_file.read_text().splitlines())
+    urls = list(
+        dict.fromkeys(
+            validate_url(line) for line in lines if line and not line.startswith("#")
+        )
+    )
+    if not urls:
+        error(f"No URLs found in {urls_file}")
+        raise typer.Exit(1)
+
+    final_browser = browser if browser is not None else app_ctx.config.add.browser
+    final_model = app_ctx.config.get_model(model or app_ctx.config.add.model)
+
+    with console.status(f"[bold dim]Fetching {len(urls)} job pages...[/bold dim]"):
+        fetch_results = fetch_many(urls, app_ctx, use_browser=final_browser)
+    hashes = [_prompt_text_sha256(r.content) for r in fetch_results]
+
+    # Probe only the ids and hashes, and close the session before the AI call
+    # so no connection or read transaction is held across it
+    with Session(app_ctx.engine) as session:
+        existing = {
+            url: (job_id, digest)
+            for url, job_id, digest in session.exec(
+                select(JobAd.job_posting_url, JobAd.id, JobAd.content_sha256).where(
+                    col(JobAd.job_posting_url).in_(urls)
+                )
+            )
+        }
+
+    # Only changed (or forced) pages go to the model
+    pending = [
+        (url, result, digest)
+        for url, result, digest in zip(urls, fetch_results, hashes)
+        if force or url not in existing or existing[url][1] != digest
+    ]
+    pending_urls = {url for url, _, _ in pending}
+    for url in urls:
+        if url not in pending_urls:
+            typer.echo(f"Job {existing[url][0]} unchanged: {url}")
+
+    if not pending:
+        return
+
+    with console.status(
+        f"[bold dim]Extracting {len(pending)} jobs using {final_model}...[/bold dim]"
+    ):
+        infos = extract_many_job_infos(
+            [url for url, _, _ in pending],
+            [result.content for _, result, _ in pending],
+            app_ctx,
+            model=final_model,
+        )
+
+    # Short write transaction for every changed job
+    with Session(app_ctx.engine, expire_on_commit=False) as session:
+        saved: dict[str, JobAd] = {}
+        for (url, result, digest), info in zip(pending, infos):
+            job_data = info.model_dump()
+            job_data["job_posting_url"] = url
+            job_data["content_sha256"] = digest
+            job_data["etag"] = result.etag
+            job_data["last_modified"] = result.last_modified
+            if url in existing:
+                job = session.get_one(JobAd, existing[url][0])
+                for key, value in job_data.items():
+                    setattr(job, key, value)
+            else:
+                job = JobAd.model_validate(job_data)
+            saved[url] = job
+
+        session.add_all(saved.values())
+        session.commit()
+
+    for url, job in saved.items():
+        action = "updated" if url in existing else "saved"
+        typer.echo(f"Job {job.id} {action}: {job.title} at {job.company}")
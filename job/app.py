@@ -3,10 +3,9 @@ from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from sqlmodel import Session, desc, select
+from sqlmodel import Session, delete, desc, select
 
 from job.core import AppContext, JobAd, JobAppDraft
-from job.core.agents import create_app_agent
 from job.utils import (
     DATETIME_FORMAT,
     error,
@@ -415,7 +414,9 @@ def write(
                     f"[dim]Loaded {len(final_extra)} extra context file(s)[/dim]"
                 )
 
-        # Create agent
+        # Create agent; deferred so the other app commands don't import pydantic_ai
+        from job.core.agents import create_app_agent
+
         agent = create_app_agent(final_model)
 
         # Build prompt
@@ -690,18 +691,16 @@ def delete_drafts(
             session.commit()
             console.print(f"[green]✓[/green] Deleted draft {draft_id} for job {job_id}")
         else:
-            # Delete all drafts for job
-            drafts = session.exec(
-                select(JobAppDraft).where(JobAppDraft.job_id == job_id)
-            ).all()
+            # Delete all drafts for job in a single statement
+            result = session.exec(
+                delete(JobAppDraft).where(JobAppDraft.job_id == job_id)
+            )
 
-            if not drafts:
+            count = result.rowcount
+            if not count:
                 error(f"No drafts found for job ID {job_id}")
                 raise typer.Exit(1)
 
-            count = len(drafts)
-            for draft in drafts:
-                session.delete(draft)
             session.commit()
 
             console.print(
@@ -41,6 +41,7 @@ class JobSearch(BaseModel):
     keywords: list[str] = Field(default_factory=list)
     parallel: bool = False
     since: int | None = None
+    concurrency: int = Field(default=8, ge=1)
     in_: list[CareerPage] = Field(default_factory=list, alias="in")
 
     @property
@@ -201,9 +202,7 @@ Rules:
 
         # XDG-compliant default
         data_home = os.getenv("XDG_DATA_HOME", Path.home() / ".local" / "share")
-        db_dir = Path(data_home) / "job"
-        db_dir.mkdir(parents=True, exist_ok=True)
-        return db_dir / "jobs.db"
+        return Path(data_home) / "job" / "jobs.db"
 
     def get_model(self, override: str | None = None) -> str:
         """Get AI model with precedence: override > config > env > default."""
@@ -1,15 +1,33 @@
 """Shared AI agent creation utilities."""
 
-from functools import cache
+from functools import lru_cache
 from pathlib import Path
 from typing import cast
 
 from pydantic_ai import Agent
+from pydantic_ai.settings import ModelSettings
 
 from job.core.models import JobAdBase, JobAppDraftBase, JobFitAssessmentBase
 
 
-@cache
+# Most agents kept alive per factory; each one holds a provider client
+AGENT_CACHE_SIZE = 8
+
+# Mark the fixed prefix (output tool schema and system prompt) as cacheable.
+# Keys are provider-prefixed, so other providers ignore them; Gemini and
+# OpenAI already cache long shared prefixes implicitly
+MODEL_SETTINGS = cast(
+    ModelSettings,
+    {"anthropic_cache_tool_definitions": True, "anthropic_cache_instructions": True},
+)
+
+# Directory holding the bundled markdown prompts
+PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
+
+# Prompt contents keyed by name, filled on first lookup
+_PROMPTS: dict[str, str] = {}
+
+
 def load_prompt(prompt_name: str) -> str:
     """Load prompt from markdown file.
 
@@ -22,15 +40,20 @@ def load_prompt(prompt_name: str) -> str:
     Raises:
         FileNotFoundError: If prompt file doesn't exist
     """
-    prompt_path = Path(__file__).parent.parent / "prompts" / f"{prompt_name}.md"
+    if prompt_name in _PROMPTS:
+        return _PROMPTS[prompt_name]
 
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
+    prompt_path = PROMPTS_DIR / f"{prompt_name}.md"
+    try:
+        content = prompt_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt file not found: {prompt_path}") from None
 
-    return prompt_path.read_text(encoding="utf-8")
+    _PROMPTS[prompt_name] = content
+    return content
 
 
-@cache
+@lru_cache(maxsize=AGENT_CACHE_SIZE)
 def create_agent(model: str, system_prompt: str) -> Agent[None, JobAdBase]:
     """Create and cache an AI agent for extracting job ads."""
     return cast(
@@ -39,11 +62,26 @@ def create_agent(model: str, system_prompt: str) -> Agent[None, JobAdBase]:
             model=model,
             output_type=JobAdBase,
             system_prompt=system_prompt,
+            model_settings=MODEL_SETTINGS,
+        ),
+    )
+
+
+@lru_cache(maxsize=AGENT_CACHE_SIZE)
+def create_batch_agent(model: str, system_prompt: str) -> Agent[None, list[JobAdBase]]:
+    """Create and cache an AI agent extracting several job ads in one call."""
+    return cast(
+        Agent[None, list[JobAdBase]],
+        Agent(
+            model=model,
+            output_type=list[JobAdBase],
+            system_prompt=system_prompt,
+            model_settings=MODEL_SETTINGS,
         ),
     )
 
 
-@cache
+@lru_cache(maxsize=AGENT_CACHE_SIZE)
 def create_app_agent(model: str) -> Agent[None, JobAppDraftBase]:
     """Create and cache an application writer agent for the given model."""
     system_prompt = load_prompt("application-writer")
@@ -53,11 +91,12 @@ def create_app_agent(model: str) -> Agent[None, JobAppDraftBase]:
             model=model,
             output_type=JobAppDraftBase,
             system_prompt=system_prompt,
+            model_settings=MODEL_SETTINGS,
         ),
     )
 
 
-@cache
+@lru_cache(maxsize=AGENT_CACHE_SIZE)
 def create_fit_agent(model: str) -> Agent[None, JobFitAssessmentBase]:
     """Create and cache a career advisor agent for the given model."""
     system_prompt = load_prompt("career-advisor")
@@ -67,5 +106,6 @@ def create_fit_agent(model: str) -> Agent[None, JobFitAssessmentBase]:
             model=model,
             output_type=JobFitAssessmentBase,
             system_prompt=system_prompt,
+            model_settings=MODEL_SETTINGS,
         ),
     )
@@ -1,8 +1,11 @@
 """Application context for dependency injection."""
 
+import zlib
 from dataclasses import dataclass, field
-from functools import cached_property
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING
 
+from sqlalchemy import event, inspect
 from sqlalchemy.engine import Engine
 from sqlmodel import SQLModel, create_engine
 from structlog.typing import FilteringBoundLogger
@@ -10,6 +13,104 @@ from structlog.typing import FilteringBoundLogger
 from job.config import Settings
 from job.core.logging import configure_logging, get_logger
 
+if TYPE_CHECKING:
+    from job.fetchers import StaticFetcher
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Use WAL journaling so commits need one fsync and readers don't block."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    # Safe with WAL: a power loss can drop the last commits but not corrupt
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    # 20 MB page cache and 256 MB of memory-mapped reads per connection
+    cursor.execute("PRAGMA cache_size=-20000")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+@lru_cache(maxsize=1)
+def _schema_fingerprint() -> int:
+    """Checksum of every model column, kept in SQLite's user_version.
+
+    Computed on first use, once all models are registered on the metadata.
+    """
+    names = sorted(
+        f"{table.name}.{column.name}"
+        for table in SQLModel.metadata.sorted_tables
+        for column in table.columns
+    )
+    return zlib.crc32("\n".join(names).encode()) & 0x7FFFFFFF
+
+
+def upgrade_schema(engine: Engine) -> tuple[list[str], list[str]]:
+    """Add nullable columns that the models define but an older database lacks.
+
+    create_all only creates missing tables, so without this a database from an
+    earlier release fails on its first query once a model gains a column.
+    A missing non-nullable column can't be added without a default, so it is
+    reported instead, and the schema fingerprint is left unset until it exists.
+
+    Returns:
+        The added columns and the missing columns that could not be added,
+        both as table.column
+    """
+    preparer = engine.dialect.identifier_preparer
+    inspector = inspect(engine)
+    added_names = []
+    skipped_names = []
+    with engine.begin() as conn:
+        for table in SQLModel.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            missing = [
+                column for column in table.columns if column.name not in existing
+            ]
+            added = [column for column in missing if column.nullable]
+            skipped_names.extend(
+                f"{table.name}.{column.name}"
+                for column in missing
+                if not column.nullable
+            )
+            for column in added:
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.exec_driver_sql(
+                    f"ALTER TABLE {preparer.format_table(table)} "
+                    f"ADD COLUMN {preparer.format_column(column)} {column_type}"
+                )
+                added_names.append(f"{table.name}.{column.name}")
+            for index in table.indexes:
+                if any(column.name in index.columns for column in added):
+                    index.create(conn, checkfirst=True)
+        # Stamped only once every column exists, so the next open checks again
+        if not skipped_names:
+            conn.exec_driver_sql(f"PRAGMA user_version = {_schema_fingerprint()}")
+    return added_names, skipped_names
+
+
+# Unbounded: a process sees only a handful of URLs, and an evicted engine
+# would never be disposed, leaving its pooled connections open
+@lru_cache(maxsize=None)
+def get_engine(url: str) -> Engine:
+    """Create the engine for a database URL once per process, with tables created.
+
+    File-backed SQLite engines use SQLAlchemy's default QueuePool, so sessions
+    reuse pooled connections instead of reopening the database.
+    """
+    engine = create_engine(url)
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    SQLModel.metadata.create_all(engine)
+    # Reflect the schema only when the models changed since the last upgrade
+    with engine.connect() as conn:
+        version = conn.exec_driver_sql("PRAGMA user_version").scalar_one()
+    if version != _schema_fingerprint():
+        added, skipped = upgrade_schema(engine)
+        if added:
+            get_logger().info("database_upgraded", added_columns=added)
+        if skipped:
+            get_logger().warning("database_columns_missing", missing_columns=skipped)
+    return engine
+
 
 @dataclass
 class AppContext:
@@ -23,9 +124,10 @@ class AppContext:
         """Lazy initialization of database engine."""
         db_path = self.config.get_db_path()
         self.logger.debug("initializing_database", path=str(db_path))
-        engine = create_engine(f"sqlite:///{db_path}")
-        SQLModel.metadata.create_all(engine)
-        return engine
+        # Created here rather than when resolving the path, so commands that
+        # never open the database don't touch the filesystem
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        return get_engine(f"sqlite:///{db_path}")
 
     @cached_property
     def logger(self) -> FilteringBoundLogger:
@@ -34,3 +136,11 @@ class AppContext:
             configure_logging(verbose=self.config.verbose)
             object.__setattr__(self, "_logging_configured", True)
         return get_logger()
+
+    @cached_property
+    def static_fetcher(self) -> "StaticFetcher":
+        """Static page fetcher shared by every fetch in this run."""
+        # Deferred so commands that never fetch don't import the fetchers
+        from job.fetchers import StaticFetcher
+
+        return StaticFetcher(timeout=self.config.REQUEST_TIMEOUT, logger=self.logger)
@@ -21,6 +21,8 @@ def configure_logging(verbose: bool = False) -> None:
         stream=sys.stderr,
         level=log_level,
     )
+    # httpx logs every request at INFO; only show those when verbose
+    logging.getLogger("httpx").setLevel(logging.NOTSET if verbose else logging.WARNING)
 
     # Configure structlog processors
     shared_processors: list[structlog.typing.Processor] = [
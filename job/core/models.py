@@ -1,6 +1,8 @@
 """Database models for job postings."""
 
+import json
 from datetime import datetime, timezone
+from functools import cached_property
 from typing import Optional
 
 from sqlmodel import Field, Relationship, SQLModel
@@ -34,6 +36,13 @@ class JobAd(JobAdBase, table=True):
     github_issue_url: str | None = Field(default=None)
     posted_at: datetime | None = Field(default=None)
 
+    # SHA-256 of the page text the structured fields were extracted from
+    content_sha256: str | None = Field(default=None)
+
+    # Validators from the last static fetch, sent back for conditional GETs
+    etag: str | None = Field(default=None)
+    last_modified: str | None = Field(default=None)
+
     fit_assessments: list["JobFitAssessment"] = Relationship(back_populates="job")
     app_drafts: list["JobAppDraft"] = Relationship(back_populates="job")
 
@@ -70,6 +79,7 @@ class JobFitAssessment(JobFitAssessmentBase, table=True):
     job_id: int = Field(foreign_key="jobad.id", index=True)
     model_name: str = Field(index=True)
     context_file_paths: str  # JSON array of paths
+    prompt_digest: str | None = Field(default=None, index=True)  # Hash of model input
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc), index=True
     )
@@ -80,6 +90,21 @@ class JobFitAssessment(JobFitAssessmentBase, table=True):
 
     job: Optional["JobAd"] = Relationship(back_populates="fit_assessments")
 
+    @cached_property
+    def strengths_list(self) -> list[str]:
+        """Strength statements decoded once from the stored JSON."""
+        return json.loads(self.strengths)
+
+    @cached_property
+    def gaps_list(self) -> list[str]:
+        """Gap statements decoded once from the stored JSON."""
+        return json.loads(self.gaps)
+
+    @cached_property
+    def context_files_list(self) -> list[str]:
+        """Context file paths decoded once from the stored JSON."""
+        return json.loads(self.context_file_paths)
+
 
 class JobAppDraftBase(SQLModel):
     """Base schema for AI-generated application documents (no DB metadata)."""
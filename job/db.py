@@ -3,6 +3,7 @@ from rich.console import Console
 from sqlmodel import Session, select, func
 
 from job.core import AppContext, JobAd, JobFitAssessment, JobAppDraft
+from job.core.context import upgrade_schema
 from job.utils import error
 
 console = Console()
@@ -94,9 +95,13 @@ def delete(
             console.print("[dim]Cancelled[/dim]")
             raise typer.Exit(0)
 
-    # Delete the database file
+    # Close pooled connections, then delete the database and its WAL files
+    if "engine" in vars(app_ctx):
+        app_ctx.engine.dispose()
     try:
         db_path.unlink()
+        for suffix in ("-wal", "-shm"):
+            db_path.with_name(db_path.name + suffix).unlink(missing_ok=True)
         console.print(f"[green]✓[/green] Deleted database: {db_path}")
     except Exception as e:
         error(f"Failed to delete database: {e}")
@@ -108,8 +113,10 @@ def migrate(ctx: typer.Context) -> None:
     """
     Migrate database schema to latest version.
 
-    Adds new columns to existing tables if they don't exist.
-    Safe to run multiple times (idempotent).
+    Adds columns that newer releases define to existing tables. This also
+    happens automatically the first time a newer release opens the database;
+    migrate re-checks every table regardless. Safe to run multiple times
+    (idempotent).
 
     Examples:
         job db migrate
@@ -117,30 +124,19 @@ def migrate(ctx: typer.Context) -> None:
     app_ctx: AppContext = ctx.obj
 
     with console.status("[bold dim]Migrating database schema...[/bold dim]"):
-        # Get raw connection to execute ALTER TABLE statements
-        with app_ctx.engine.connect() as conn:
-            # Check if github_repo column exists
-            result = conn.exec_driver_sql(
-                "SELECT COUNT(*) FROM pragma_table_info('jobad') WHERE name='github_repo'"
-            )
-            has_github_fields = result.scalar() > 0
-
-            if not has_github_fields:
-                # Add GitHub metadata columns
-                conn.exec_driver_sql("ALTER TABLE jobad ADD COLUMN github_repo VARCHAR")
-                conn.exec_driver_sql(
-                    "ALTER TABLE jobad ADD COLUMN github_issue_number INTEGER"
-                )
-                conn.exec_driver_sql(
-                    "ALTER TABLE jobad ADD COLUMN github_issue_url VARCHAR"
-                )
-                conn.exec_driver_sql("ALTER TABLE jobad ADD COLUMN posted_at DATETIME")
-                conn.commit()
-
-                console.print(
-                    "[green]✓[/green] Added GitHub metadata columns to jobad table"
-                )
-            else:
-                console.print("[dim]Database schema is already up to date[/dim]")
+        added, skipped = upgrade_schema(app_ctx.engine)
+
+    for name in added:
+        console.print(f"[green]✓[/green] Added column {name}")
+    if skipped:
+        # A required column has no value for existing rows, so ALTER TABLE
+        # can't add it; the database must be rebuilt
+        error(
+            f"Cannot add required column(s): {', '.join(skipped)}. "
+            "Export your jobs and recreate the database (job db del)"
+        )
+        raise typer.Exit(1)
+    if not added:
+        console.print("[dim]Database schema is already up to date[/dim]")
 
     console.print("[green]✓[/green] Migration complete")
@@ -2,12 +2,13 @@
 
 from job.fetchers.base import AsyncPageFetcher, PageFetcher
 from job.fetchers.browser import AsyncBrowserFetcher, BrowserFetcher
-from job.fetchers.static import StaticFetcher
+from job.fetchers.static import AsyncStaticFetcher, StaticFetcher
 
 __all__ = [
     "PageFetcher",
     "AsyncPageFetcher",
     "StaticFetcher",
+    "AsyncStaticFetcher",
     "BrowserFetcher",
     "AsyncBrowserFetcher",
 ]
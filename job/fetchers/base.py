@@ -3,6 +3,10 @@
 from dataclasses import dataclass
 from typing import Protocol
 
+# Longest page text sent to the model for extraction; postings fit well within
+# this. Search always works on the full page text
+MAX_CONTENT_CHARS = 30_000
+
 
 @dataclass
 class FetchResult:
@@ -10,6 +14,11 @@ class FetchResult:
 
     content: str
     title: str | None = None
+    # HTTP cache validators, for conditional re-fetches (static fetches only)
+    etag: str | None = None
+    last_modified: str | None = None
+    # True when a conditional request got 304; content is then empty
+    not_modified: bool = False
 
 
 class PageFetcher(Protocol):
@@ -1,15 +1,102 @@
 """Browser-based page fetcher using Playwright (sync and async)."""
 
+import asyncio
+import atexit
 import subprocess
 import sys
 
-from playwright.async_api import async_playwright
-from playwright.sync_api import TimeoutError as PlaywrightTimeout, sync_playwright
+from playwright.async_api import (
+    Browser as AsyncBrowser,
+    Page as AsyncPage,
+    Playwright as AsyncPlaywright,
+    Route as AsyncRoute,
+    async_playwright,
+)
+from playwright.sync_api import (
+    Browser,
+    Page,
+    Playwright,
+    Route,
+    TimeoutError as PlaywrightTimeout,
+    sync_playwright,
+)
 from structlog.typing import FilteringBoundLogger
 
 from job.core.logging import get_logger
 from job.fetchers.base import FetchResult
 
+# Requests aborted in browser fetches; only the page text is used. Stylesheets
+# still load because inner_text depends on what CSS hides
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# Process-wide Playwright driver and Chromium for sync fetches, started on
+# first use and shut down at exit
+_playwright: Playwright | None = None
+_browser: Browser | None = None
+
+
+def _block_assets(route: Route) -> None:
+    """Abort requests for assets that don't affect page text."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+async def _block_assets_async(route: AsyncRoute) -> None:
+    """Abort requests for assets that don't affect page text."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _install_browser(logger: FilteringBoundLogger) -> None:
+    """Install the Playwright Chromium build."""
+    logger.info("installing_browser")
+    result = subprocess.run(
+        [sys.executable, "-m", "playwright", "install", "chromium"],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to install browser: {result.stderr}")
+
+
+def _close_browser() -> None:
+    """Close the shared browser and stop the Playwright driver."""
+    global _playwright, _browser
+    try:
+        if _browser is not None:
+            _browser.close()
+        if _playwright is not None:
+            _playwright.stop()
+    finally:
+        _playwright = _browser = None
+
+
+def _get_browser(logger: FilteringBoundLogger) -> Browser:
+    """Get the shared Chromium, launching it (and installing if needed) once."""
+    global _playwright, _browser
+    if _browser is not None:
+        return _browser
+
+    _playwright = sync_playwright().start()
+    try:
+        try:
+            _browser = _playwright.chromium.launch(headless=True)
+        except Exception as e:
+            logger.info("browser_not_available", error=str(e))
+            _install_browser(logger)
+            _browser = _playwright.chromium.launch(headless=True)
+    except Exception:
+        _close_browser()
+        raise
+
+    atexit.register(_close_browser)
+    return _browser
+
 
 class BrowserFetcher:
     """Fetch page content using Playwright sync API (for CLI commands)."""
@@ -25,45 +112,36 @@ class BrowserFetcher:
 
         Args:
             timeout_ms: Page load timeout in milliseconds
-            wait_time_ms: Additional wait time for dynamic content
+            wait_time_ms: Maximum wait for dynamic content after page load
             logger: Optional structlog logger
         """
         self.timeout_ms = timeout_ms
         self.wait_time_ms = wait_time_ms
         self.logger = logger or get_logger()
-        self._ensure_browser_installed()
 
-    def _ensure_browser_installed(self) -> None:
-        """Ensure Playwright browser is installed."""
+    def _wait_for_content(self, page: Page) -> None:
+        """Wait until the network goes idle, at most wait_time_ms."""
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                browser.close()
-        except Exception as e:
-            self.logger.info("browser_not_available", error=str(e))
-            self.logger.info("installing_browser")
-            result = subprocess.run(
-                [sys.executable, "-m", "playwright", "install", "chromium"],
-                check=False,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode != 0:
-                raise RuntimeError(f"Failed to install browser: {result.stderr}")
+            page.wait_for_load_state("networkidle", timeout=self.wait_time_ms)
+        except PlaywrightTimeout:
+            # Pages that keep polling never go idle; use what has rendered
+            pass
 
     def _fetch(self, url: str) -> FetchResult:
-        """Fetch using a fresh browser instance."""
+        """Fetch in a fresh context of the shared browser instance."""
         self.logger.debug("fetching_browser", url=url)
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
+        context = _get_browser(self.logger).new_context()
+        try:
+            context.route("**/*", _block_assets)
+            page = context.new_page()
             page.goto(url, wait_until="domcontentloaded", timeout=self.timeout_ms)
-            page.wait_for_timeout(self.wait_time_ms)
+            self._wait_for_content(page)
             text = page.inner_text("body")
             title = page.title()
-            browser.close()
-            self.logger.debug("fetch_complete", chars=len(text), title=title)
-            return FetchResult(content=text, title=title)
+        finally:
+            context.close()
+        self.logger.debug("fetch_complete", chars=len(text), title=title)
+        return FetchResult(content=text, title=title)
 
     def fetch(self, url: str) -> FetchResult:
         """
@@ -90,7 +168,13 @@ class BrowserFetcher:
 
 
 class AsyncBrowserFetcher:
-    """Fetch page content using Playwright async API (for concurrent operations)."""
+    """Fetch page content using Playwright async API (for concurrent operations).
+
+    Used as an async context manager, one browser is launched on the first
+    fetch and shared by all later ones, each in its own context so cookies
+    and storage don't leak between sites. Otherwise every fetch launches and
+    closes a browser of its own.
+    """
 
     def __init__(
         self,
@@ -103,26 +187,86 @@ class AsyncBrowserFetcher:
 
         Args:
             timeout_ms: Page load timeout in milliseconds
-            wait_time_ms: Additional wait time for dynamic content
+            wait_time_ms: Maximum wait for dynamic content after page load
             logger: Optional structlog logger
         """
         self.timeout_ms = timeout_ms
         self.wait_time_ms = wait_time_ms
         self.logger = logger or get_logger()
+        self._shared = False
+        self._launch_lock = asyncio.Lock()
+        self._playwright: AsyncPlaywright | None = None
+        self._browser: AsyncBrowser | None = None
+
+    async def __aenter__(self) -> "AsyncBrowserFetcher":
+        self._shared = True
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._shared = False
+        await self._close()
+
+    async def _get_browser(self) -> AsyncBrowser:
+        """Get the shared browser, launching it once."""
+        async with self._launch_lock:
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                try:
+                    self._browser = await self._playwright.chromium.launch(
+                        headless=True
+                    )
+                except Exception:
+                    await self._close()
+                    raise
+            return self._browser
+
+    async def _close(self) -> None:
+        """Close the browser and stop the Playwright driver."""
+        try:
+            if self._browser is not None:
+                await self._browser.close()
+            if self._playwright is not None:
+                await self._playwright.stop()
+        finally:
+            self._playwright = self._browser = None
+
+    async def _wait_for_content(self, page: AsyncPage) -> None:
+        """Wait until the network goes idle, at most wait_time_ms."""
+        try:
+            await page.wait_for_load_state("networkidle", timeout=self.wait_time_ms)
+        except PlaywrightTimeout:
+            # Pages that keep polling never go idle; use what has rendered
+            pass
 
     async def _fetch(self, url: str) -> FetchResult:
-        """Fetch using a fresh browser instance."""
+        """Fetch with the shared browser, or a single-use one if not entered."""
+        if self._shared:
+            return await self._fetch_with(await self._get_browser(), url)
+
+        # Kept local rather than on self, so concurrent calls can't close it
+        # under each other
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=True)
+            try:
+                return await self._fetch_with(browser, url)
+            finally:
+                await browser.close()
+
+    async def _fetch_with(self, browser: AsyncBrowser, url: str) -> FetchResult:
+        """Fetch in a fresh context of the given browser."""
         self.logger.debug("fetching_browser_async", url=url)
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+        context = await browser.new_context()
+        try:
+            await context.route("**/*", _block_assets_async)
+            page = await context.new_page()
             await page.goto(url, wait_until="domcontentloaded", timeout=self.timeout_ms)
-            await page.wait_for_timeout(self.wait_time_ms)
+            await self._wait_for_content(page)
             text = await page.inner_text("body")
             title = await page.title()
-            await browser.close()
-            self.logger.debug("fetch_complete", chars=len(text), title=title)
-            return FetchResult(content=text, title=title)
+        finally:
+            await context.close()
+        self.logger.debug("fetch_complete", chars=len(text), title=title)
+        return FetchResult(content=text, title=title)
 
     async def fetch(self, url: str) -> FetchResult:
         """
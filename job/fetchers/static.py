@@ -1,12 +1,65 @@
 """Static page fetcher using requests."""
 
+import asyncio
+
+import httpx
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from structlog.typing import FilteringBoundLogger
 
 from job.core.logging import get_logger
 from job.fetchers.base import FetchResult
 
+# Tags that never hold listing text
+NON_CONTENT_TAGS = ["script", "style", "noscript", "svg"]
+
+# Host pools, and connections per host, kept by the shared session
+POOL_SIZE = 8
+
+# Most requests in flight at once from one async fetcher
+MAX_IN_FLIGHT = 20
+
+
+def _extract_text(html: str, main_content: bool = False) -> tuple[str, str | None]:
+    """Extract the page text and the title from an HTML document.
+
+    Args:
+        html: The HTML document
+        main_content: If True, keep only the main content region (for AI
+            extraction); otherwise return the full body text
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.title.string if soup.title else None
+    root = soup.body or soup
+    if main_content:
+        for tag in soup(NON_CONTENT_TAGS):
+            tag.decompose()
+        # Prefer the main content region over navigation and footers. An
+        # <article> only counts when it is the only one; listings have many
+        articles = soup.find_all("article", limit=2)
+        root = (
+            soup.find("main")
+            or (articles[0] if len(articles) == 1 else None)
+            or soup.find(role="main")
+            or root
+        )
+    text = root.get_text(separator="\n", strip=True)
+    return text, title
+
+
+def _create_session() -> requests.Session:
+    """Create a session whose pooled connections are reused across fetches."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by all fetchers, so repeat fetches skip the TCP and TLS handshakes
+_SESSION = _create_session()
+
 
 class StaticFetcher:
     """Fetch page content using requests (for static pages)."""
@@ -22,34 +75,135 @@ class StaticFetcher:
         self.timeout = timeout
         self.logger = logger or get_logger()
 
-    def fetch(self, url: str) -> FetchResult:
+    def fetch(
+        self,
+        url: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        main_content: bool = False,
+    ) -> FetchResult:
         """
         Fetch page content using requests.
 
         Args:
             url: The URL to fetch
+            etag: ETag from a previous fetch, sent as If-None-Match
+            last_modified: Last-Modified from a previous fetch, sent as
+                If-Modified-Since
+            main_content: If True, return only the page's main content region
 
         Returns:
-            Extracted text content from the page
+            Extracted text content from the page, or a result with
+            not_modified=True if the server answered 304
 
         Raises:
             requests.RequestException: If the request fails
         """
         self.logger.debug("fetching_static", url=url)
         try:
-            resp = requests.get(url, timeout=self.timeout)
+            headers = {}
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+            resp = _SESSION.get(url, timeout=self.timeout, headers=headers)
+            if resp.status_code == 304:
+                self.logger.debug("not_modified", url=url)
+                return FetchResult(
+                    content="",
+                    etag=etag,
+                    last_modified=last_modified,
+                    not_modified=True,
+                )
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
-            if soup.body:
-                text = soup.body.get_text(separator="\n", strip=True)
-            else:
-                text = soup.get_text(separator="\n", strip=True)
-            title = soup.title.string if soup.title else None
+            text, title = _extract_text(resp.text, main_content=main_content)
             self.logger.debug("fetch_complete", chars=len(text), title=title)
-            return FetchResult(content=text, title=title)
+            return FetchResult(
+                content=text,
+                title=title,
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+            )
         except requests.Timeout:
             self.logger.warning("request_timeout", timeout_seconds=self.timeout)
             raise
         except requests.RequestException as e:
             self.logger.error("request_failed", error=str(e))
             raise
+
+
+class AsyncStaticFetcher:
+    """Fetch page content using httpx (for concurrent static fetches).
+
+    Used as an async context manager, fetches share one connection pool.
+    Otherwise every fetch opens and closes a client of its own.
+    """
+
+    def __init__(
+        self,
+        timeout: int = 15,
+        logger: FilteringBoundLogger | None = None,
+        max_in_flight: int = MAX_IN_FLIGHT,
+    ):
+        """
+        Initialize async static fetcher.
+
+        Args:
+            timeout: Request timeout in seconds
+            logger: Optional structlog logger
+            max_in_flight: Most requests allowed in flight at once
+        """
+        self.timeout = timeout
+        self.logger = logger or get_logger()
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> "AsyncStaticFetcher":
+        self._client = httpx.AsyncClient(timeout=self.timeout, follow_redirects=True)
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch(self, url: str) -> FetchResult:
+        """
+        Fetch page content using httpx.
+
+        Args:
+            url: The URL to fetch
+
+        Returns:
+            Extracted text content from the page
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        if self._client is not None:
+            return await self._fetch_with(self._client, url)
+
+        # Kept local rather than on self, so concurrent calls can't close it
+        # under each other
+        async with httpx.AsyncClient(
+            timeout=self.timeout, follow_redirects=True
+        ) as client:
+            return await self._fetch_with(client, url)
+
+    async def _fetch_with(self, client: httpx.AsyncClient, url: str) -> FetchResult:
+        """Fetch and extract the page text using the given client."""
+        self.logger.debug("fetching_static_async", url=url)
+        try:
+            async with self._semaphore:
+                resp = await client.get(url)
+            resp.raise_for_status()
+        except httpx.TimeoutException:
+            self.logger.warning("request_timeout", timeout_seconds=self.timeout)
+            raise
+        except httpx.HTTPError as e:
+            self.logger.error("request_failed", error=str(e))
+            raise
+
+        text, title = _extract_text(resp.text)
+        self.logger.debug("fetch_complete", chars=len(text), title=title)
+        return FetchResult(content=text, title=title)
@@ -1,12 +1,14 @@
+import hashlib
 import json
 import typer
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
-from sqlmodel import Session, desc, select
+from sqlalchemy.orm import load_only
+from sqlmodel import Session, and_, delete, desc, select
 
 from job.core import AppContext, JobAd, JobFitAssessment, JobFitAssessmentBase
-from job.core.agents import create_fit_agent
 from job.utils import (
     DATETIME_FORMAT,
     error,
@@ -14,7 +16,6 @@ from job.utils import (
     get_score_color,
     get_score_style,
     handle_ai_errors,
-    parse_json_or_list,
     read_context_files,
 )
 
@@ -23,6 +24,25 @@ console = Console()
 # Create sub-app for fit commands
 app = typer.Typer(no_args_is_help=True, help="Assess job fit with ai (Alias: f)")
 
+# Assessment columns only needed when a single assessment is displayed
+ASSESSMENT_DETAIL_FIELDS = [
+    "fit_summary",
+    "strengths",
+    "gaps",
+    "recommendations",
+    "key_insights",
+]
+
+
+def _context_files_display(paths: list[str], width: int = 37) -> str:
+    """Join context file names, stopping once the result exceeds width."""
+    display = ""
+    for i, path in enumerate(paths):
+        display += (", " if i else "") + Path(path).name
+        if len(display) > width:
+            return display[: width - 3] + "..."
+    return display
+
 
 def display_fit_assessment(
     job: JobAd, assessment: JobFitAssessmentBase | JobFitAssessment, assessment_id: int
@@ -44,7 +64,7 @@ def display_fit_assessment(
     # Show metadata if this is a stored assessment
     if isinstance(assessment, JobFitAssessment):
         console.print()
-        context_files = parse_json_or_list(assessment.context_file_paths)
+        context_files = assessment.context_files_list
         context_display = "\n".join([f"  • {Path(p).name}" for p in context_files])
         console.print(
             Panel(
@@ -70,9 +90,14 @@ def display_fit_assessment(
         )
     )
 
+    # Stored assessments keep their lists as JSON strings
+    if isinstance(assessment, JobFitAssessment):
+        strengths, gaps = assessment.strengths_list, assessment.gaps_list
+    else:
+        strengths, gaps = assessment.strengths, assessment.gaps
+
     # Strengths
     console.print()
-    strengths = parse_json_or_list(assessment.strengths)
     strengths_text = "\n".join([f"• {strength}" for strength in strengths])
     console.print(
         Panel(
@@ -84,7 +109,6 @@ def display_fit_assessment(
 
     # Gaps
     console.print()
-    gaps = parse_json_or_list(assessment.gaps)
     gaps_text = "\n".join([f"• {gap}" for gap in gaps])
     console.print(
         Panel(
@@ -137,18 +161,24 @@ def run(
     model: str = typer.Option(
         None, "--model", "-m", help="AI model to use (from config if not specified)"
     ),
+    force: bool = typer.Option(
+        False, "--force", help="Re-run even if an identical assessment exists"
+    ),
 ) -> None:
     """
     Assess job fit against candidate context. (Alias: r)
 
     Analyzes how well a job matches your background based on CV and other context files.
     Requires job_id as positional argument. CV and extra files can be provided via flags
-    or from config (job.toml).
+    or from config (job.toml). If the same job and context content were already
+    assessed with the same model, the stored assessment is shown instead
+    (unless --force is used).
 
     Examples:
         job fit run 42 --cv cv.pdf --extra persona.md --extra experience.md
         job fit r 42 -e reference.md -m claude-sonnet-4.5
         job fit run 42  # uses cv and extra from job.toml
+        job fit run 42 --force  # ask the model again
     """
     app_ctx: AppContext = ctx.obj
 
@@ -171,21 +201,29 @@ def run(
     # Determine model (CLI > fit-specific config > global config)
     final_model = app_ctx.config.get_model(model or app_ctx.config.fit.model)
 
-    # Read context files
-    with console.status("[bold dim]Reading context files...[/bold dim]"):
-        context_content, context_paths = read_context_files(
-            final_context, return_paths=True
+    # Read context files in the background while pydantic_ai is imported and
+    # the agent is built, the slowest steps before the model call
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        context_future = pool.submit(
+            read_context_files, final_context, return_paths=True
         )
 
+        # Deferred so the other fit commands don't import pydantic_ai
+        from job.core.agents import create_fit_agent
+
+        agent = create_fit_agent(final_model)
+
+        with console.status("[bold dim]Reading context files...[/bold dim]"):
+            context_content, context_paths = context_future.result()
+
     console.print(f"[dim]Loaded {len(context_paths)} context file(s)[/dim]")
 
-    # Get job from database
-    with Session(app_ctx.engine) as session:
+    # Get job from database; keep loaded state after commit so neither the job
+    # nor the new record is re-read just to display it
+    with Session(app_ctx.engine, expire_on_commit=False) as session:
         job = get_or_exit(session, JobAd, job_id, "job")
 
         # Run fit assessment
-        agent = create_fit_agent(final_model)
-
         prompt = f"""Assess the job fit for this candidate.
 
 JOB POSTING:
@@ -204,6 +242,26 @@ CANDIDATE CONTEXT:
 
 Provide a comprehensive fit assessment."""
 
+        # Identical prompts (same job and context content, wherever the files
+        # live) reuse the stored assessment instead of calling the model again
+        prompt_digest = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        if not force:
+            existing = session.exec(
+                select(JobFitAssessment)
+                .where(JobFitAssessment.job_id == job_id)
+                .where(JobFitAssessment.model_name == final_model)
+                .where(JobFitAssessment.prompt_digest == prompt_digest)
+                .order_by(desc(JobFitAssessment.created_at))
+            ).first()
+            if existing:
+                assert existing.id is not None  # ID exists for loaded record
+                console.print(
+                    f"[dim]Reusing assessment {existing.id} (same job, context and model); "
+                    "use --force to re-run[/dim]"
+                )
+                display_fit_assessment(job, existing, existing.id)
+                return
+
         with console.status(
             f"[bold dim]Analyzing fit with {final_model}...[/bold dim]"
         ):
@@ -222,11 +280,11 @@ Provide a comprehensive fit assessment."""
             gaps=json.dumps(assessment.gaps),
             recommendations=assessment.recommendations,
             key_insights=assessment.key_insights,
+            prompt_digest=prompt_digest,
         )
 
         session.add(fit_record)
         session.commit()
-        session.refresh(fit_record)
 
         # Display results
         assert fit_record.id is not None  # ID is set after commit
@@ -256,17 +314,29 @@ def view(
     app_ctx: AppContext = ctx.obj
 
     with Session(app_ctx.engine) as session:
-        # Get the job first
-        job = get_or_exit(session, JobAd, job_id, "job")
-
         # If assessment_id is provided, view that specific one for this job
         if assessment_id is not None:
-            assessment = get_or_exit(
-                session, JobFitAssessment, assessment_id, "assessment"
-            )
+            # Load the job and the requested assessment in one round trip
+            row = session.exec(
+                select(JobAd, JobFitAssessment)
+                .outerjoin(
+                    JobFitAssessment,
+                    and_(
+                        JobFitAssessment.job_id == JobAd.id,
+                        JobFitAssessment.id == assessment_id,
+                    ),
+                )
+                .where(JobAd.id == job_id)
+            ).first()
 
-            # Verify the assessment belongs to this job
-            if assessment.job_id != job_id:
+            if row is None:
+                error(f"No job found with ID: {job_id}")
+                raise typer.Exit(1)
+
+            job, assessment = row
+            if assessment is None:
+                # Tell a missing assessment apart from one owned by another job
+                get_or_exit(session, JobFitAssessment, assessment_id, "assessment")
                 error(f"Assessment {assessment_id} does not belong to job {job_id}")
                 raise typer.Exit(1)
 
@@ -276,13 +346,39 @@ def view(
 
         # Otherwise, list assessments for the job
 
-        # Get all assessments for this job
-        assessments = session.exec(
-            select(JobFitAssessment)
-            .where(JobFitAssessment.job_id == job_id)
+        # Get the job together with all of its assessments, loading only the
+        # columns the listing shows; details are fetched for the one displayed
+        rows = session.exec(
+            select(JobAd, JobFitAssessment)
+            .outerjoin(JobFitAssessment)
+            .where(JobAd.id == job_id)
             .order_by(desc(JobFitAssessment.created_at))
+            .options(
+                load_only(
+                    JobAd.id,
+                    JobAd.title,
+                    JobAd.company,
+                    JobAd.location,
+                    JobAd.job_posting_url,
+                ),
+                load_only(
+                    JobFitAssessment.id,
+                    JobFitAssessment.job_id,
+                    JobFitAssessment.model_name,
+                    JobFitAssessment.context_file_paths,
+                    JobFitAssessment.created_at,
+                    JobFitAssessment.overall_fit_score,
+                ),
+            )
         ).all()
 
+        if not rows:
+            error(f"No job found with ID: {job_id}")
+            raise typer.Exit(1)
+
+        job = rows[0][0]
+        assessments = [assessment for _, assessment in rows if assessment is not None]
+
         if not assessments:
             error(f"No fit assessments found for job ID {job_id}")
             console.print(
@@ -294,6 +390,7 @@ def view(
         if len(assessments) == 1:
             assessment = assessments[0]
             assert assessment.id is not None  # ID exists for loaded record
+            session.refresh(assessment, ASSESSMENT_DETAIL_FIELDS)
             display_fit_assessment(job, assessment, assessment.id)
             return
 
@@ -312,11 +409,7 @@ def view(
         table.add_column("Context Files", width=40)
 
         for assessment in assessments:
-            # Parse context files for display
-            context_files = parse_json_or_list(assessment.context_file_paths)
-            context_display = ", ".join([Path(p).name for p in context_files])
-            if len(context_display) > 37:
-                context_display = context_display[:34] + "..."
+            context_display = _context_files_display(assessment.context_files_list)
 
             # Color code score
             color = get_score_color(assessment.overall_fit_score)
@@ -353,6 +446,7 @@ def view(
             # Display the selected assessment
             console.print()
             assert selected.id is not None  # ID exists for loaded record
+            session.refresh(selected, ASSESSMENT_DETAIL_FIELDS)
             display_fit_assessment(job, selected, selected.id)
 
         except ValueError:
@@ -519,19 +613,16 @@ def delete_assessments(
             )
 
         else:
-            # Delete all assessments for the job
-            assessments = session.exec(
-                select(JobFitAssessment).where(JobFitAssessment.job_id == job_id)
-            ).all()
+            # Delete all assessments for the job in a single statement
+            result = session.exec(
+                delete(JobFitAssessment).where(JobFitAssessment.job_id == job_id)
+            )
 
-            if not assessments:
+            count = result.rowcount
+            if not count:
                 error(f"No assessments found for job ID {job_id}")
                 raise typer.Exit(1)
 
-            # Delete all
-            count = len(assessments)
-            for assessment in assessments:
-                session.delete(assessment)
             session.commit()
 
             console.print(
@@ -1,19 +1,23 @@
 """GitHub integration commands."""
 
-import subprocess
-import tempfile
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 
 import typer
 from rich.console import Console
-from sqlmodel import Session
+from sqlmodel import Session, col, desc, select
 
+from job import gh_http
 from job.core import AppContext, JobAd, JobFitAssessment
-from job.utils import DATETIME_FORMAT, error, get_or_exit, parse_json_or_list
+from job.utils import DATETIME_FORMAT, error, get_or_exit
 
 console = Console()
 
+# Upper bound on concurrent comment posts for --batch
+MAX_POST_WORKERS = 8
+
 # Create sub-app for GitHub commands
 app = typer.Typer(no_args_is_help=True, help="GitHub integration commands")
 
@@ -78,60 +82,91 @@ def issue(
 {job.full_ad}
 """
 
-        # Write to temp file for gh CLI
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(issue_body)
-            temp_path = f.name
-
-        try:
-            # Create issue using gh CLI
-            console.print(f"[dim]Creating issue in {final_repo}...[/dim]")
-
-            result = subprocess.run(
-                [
-                    "gh",
-                    "issue",
-                    "create",
-                    "--repo",
-                    final_repo,
-                    "--title",
-                    f"{job.title} at {job.company}",
-                    "--body-file",
-                    temp_path,
-                ],
-                capture_output=True,
-                text=True,
-            )
-
-            if result.returncode != 0:
-                error(f"Failed to create issue: {result.stderr}")
-                raise typer.Exit(1)
-
-            # Parse issue URL from output
-            issue_url = result.stdout.strip()
-
-            # Extract issue number from URL (format: https://github.com/owner/repo/issues/123)
-            try:
-                issue_number = int(issue_url.split("/")[-1])
-            except (ValueError, IndexError):
-                error(f"Could not parse issue number from: {issue_url}")
-                raise typer.Exit(1)
+        console.print(f"[dim]Creating issue in {final_repo}...[/dim]")
+
+        created = gh_http.post(
+            f"/repos/{final_repo}/issues",
+            {"title": f"{job.title} at {job.company}", "body": issue_body},
+            "create issue",
+        )
+        issue_url = created["html_url"]
+        issue_number = created["number"]
+
+        # Update job with GitHub metadata
+        job.github_repo = final_repo
+        job.github_issue_number = issue_number
+        job.github_issue_url = issue_url
+        job.posted_at = datetime.now(timezone.utc)
+
+        session.add(job)
+        session.commit()
+
+        console.print(f"[green]✓[/green] Created issue: {issue_url}")
+        console.print(f"[dim]Job ID {job.id} → {final_repo}#{issue_number}[/dim]")
+
+
+def _comment_markdown(assessment: JobFitAssessment, job: JobAd) -> str:
+    """Format an assessment as a markdown issue comment."""
+    context_display = ", ".join([Path(p).name for p in assessment.context_files_list])
+
+    # Build markdown comment in one join over literal chunks and bullets
+    parts = [
+        "## Job Fit Assessment\n\n",
+        f"**Job:** [{job.title}]({job.job_posting_url})\n",
+        f"**Company:** {job.company}\n",
+        f"**Location:** {job.location}\n\n---\n\n",
+        f"### Overall Fit: {assessment.overall_fit_score}/100\n\n",
+        f"{assessment.fit_summary}\n\n---\n\n",
+        "### ✅ Strengths\n\n",
+    ]
+    parts.extend(f"- {s}\n" for s in assessment.strengths_list)
+    parts.append("\n---\n\n### ⚠️ Gaps\n\n")
+    parts.extend(f"- {g}\n" for g in assessment.gaps_list)
+    parts += [
+        "\n---\n\n### 💡 Recommendations\n\n",
+        f"{assessment.recommendations}\n\n---\n\n",
+        "### 🔍 Key Insights\n\n",
+        f"{assessment.key_insights}\n\n---\n\n",
+        "<details>\n<summary>Assessment Details</summary>\n\n",
+        f"**Model:** {assessment.model_name}\n",
+        f"**Created:** {assessment.created_at.strftime(DATETIME_FORMAT)}\n",
+        f"**Context:** {context_display}\n",
+        f"**Assessment ID:** {assessment.id}\n\n</details>\n",
+    ]
+    return "".join(parts)
+
+
+def _comment_target(
+    assessment: JobFitAssessment, job: JobAd | None, repo: str, issue: int
+) -> tuple[str, int]:
+    """Resolve the repo and issue to comment on, from options or job metadata.
+
+    Raises:
+        typer.Exit: If the job is missing or has no GitHub metadata to fall back on
+    """
+    if job is None:
+        error(f"No job found with ID: {assessment.job_id}")
+        raise typer.Exit(1)
 
-            # Update job with GitHub metadata
-            job.github_repo = final_repo
-            job.github_issue_number = issue_number
-            job.github_issue_url = issue_url
-            job.posted_at = datetime.now(timezone.utc)
+    # Auto-detect repo and issue from job metadata if not provided
+    final_repo = repo or job.github_repo
+    final_issue = issue or job.github_issue_number
 
-            session.add(job)
-            session.commit()
+    if not final_repo:
+        error("Repository not specified and job has no GitHub metadata")
+        console.print(
+            "[dim]Provide --repo or create issue first with 'job gh issue'[/dim]"
+        )
+        raise typer.Exit(1)
 
-            console.print(f"[green]✓[/green] Created issue: {issue_url}")
-            console.print(f"[dim]Job ID {job.id} → {final_repo}#{issue_number}[/dim]")
+    if not final_issue:
+        error("Issue number not specified and job has no GitHub metadata")
+        console.print(
+            "[dim]Provide --issue or create issue first with 'job gh issue'[/dim]"
+        )
+        raise typer.Exit(1)
 
-        finally:
-            # Clean up temp file
-            Path(temp_path).unlink(missing_ok=True)
+    return final_repo, final_issue
 
 
 @app.command(name="c", hidden=True, no_args_is_help=True)
@@ -139,7 +174,13 @@ def issue(
 def comment(
     ctx: typer.Context,
     assessment_id: int = typer.Option(
-        ..., "--assessment", "-a", help="Assessment ID to post"
+        None, "--assessment", "-a", help="Assessment ID to post"
+    ),
+    latest_for_job: int = typer.Option(
+        None, "--latest-for-job", "-j", help="Post the newest assessment for a job ID"
+    ),
+    batch: bool = typer.Option(
+        False, "--batch", help="Read assessment IDs from stdin and post them all"
     ),
     repo: str = typer.Option(
         None,
@@ -156,136 +197,109 @@ def comment(
 
     Formats the assessment as markdown and posts it as a comment to a GitHub issue.
     If the job was previously posted via 'job gh issue', repo and issue number
-    are auto-detected from the database.
+    are auto-detected from the database. With --batch, assessment IDs are read
+    from stdin and posted concurrently over one connection.
 
     Examples:
         job gh comment -a 5 --repo xrsl/cv --issue 45
         job gh c -a 5  # auto-detect repo/issue from job metadata
         job gh c -a 3 --issue 12  # auto-detect repo only
+        job gh c -j 2  # newest assessment for job 2
+        echo 3 4 5 | job gh c --batch
     """
     app_ctx: AppContext = ctx.obj
 
-    with Session(app_ctx.engine) as session:
-        # Get the assessment
-        assessment = get_or_exit(session, JobFitAssessment, assessment_id, "assessment")
-
-        # Get the job
-        job = get_or_exit(session, JobAd, assessment.job_id, "job")
-
-        # Auto-detect repo and issue from job metadata if not provided
-        final_repo = repo or job.github_repo
-        final_issue = issue or job.github_issue_number
-
-        if not final_repo:
-            error("Repository not specified and job has no GitHub metadata")
-            console.print(
-                "[dim]Provide --repo or create issue first with 'job gh issue'[/dim]"
-            )
-            raise typer.Exit(1)
-
-        if not final_issue:
-            error("Issue number not specified and job has no GitHub metadata")
-            console.print(
-                "[dim]Provide --issue or create issue first with 'job gh issue'[/dim]"
-            )
-            raise typer.Exit(1)
-
-        # Format assessment as markdown
-        context_files = parse_json_or_list(assessment.context_file_paths)
-        context_display = ", ".join([Path(p).name for p in context_files])
-
-        # Parse strengths and gaps
-        strengths = parse_json_or_list(assessment.strengths)
-        gaps = parse_json_or_list(assessment.gaps)
-
-        # Build markdown comment
-        markdown = f"""## Job Fit Assessment
-
-**Job:** [{job.title}]({job.job_posting_url})
-**Company:** {job.company}
-**Location:** {job.location}
-
----
-
-### Overall Fit: {assessment.overall_fit_score}/100
-
-{assessment.fit_summary}
-
----
-
-### ✅ Strengths
-
-{chr(10).join([f"- {s}" for s in strengths])}
-
----
-
-### ⚠️ Gaps
-
-{chr(10).join([f"- {g}" for g in gaps])}
-
----
-
-### 💡 Recommendations
-
-{assessment.recommendations}
-
----
-
-### 🔍 Key Insights
-
-{assessment.key_insights}
-
----
-
-<details>
-<summary>Assessment Details</summary>
-
-**Model:** {assessment.model_name}
-**Created:** {assessment.created_at.strftime(DATETIME_FORMAT)}
-**Context:** {context_display}
-**Assessment ID:** {assessment_id}
-
-</details>
-"""
-
-        # Write to temp file for gh CLI
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(markdown)
-            temp_path = f.name
-
-        try:
-            # Post using gh CLI
-            console.print(
-                f"[dim]Posting assessment {assessment_id} to {final_repo}#{final_issue}...[/dim]"
-            )
+    if (assessment_id is not None) + (latest_for_job is not None) + batch != 1:
+        error("Provide exactly one of --assessment, --latest-for-job or --batch")
+        raise typer.Exit(1)
 
-            result = subprocess.run(
-                [
-                    "gh",
-                    "issue",
-                    "comment",
-                    str(final_issue),
-                    "--repo",
-                    final_repo,
-                    "--body-file",
-                    temp_path,
-                ],
-                capture_output=True,
-                text=True,
-            )
+    # Each assessment is loaded together with its job in one round trip
+    stmt = select(JobFitAssessment, JobAd).outerjoin(JobAd)
 
-            if result.returncode != 0:
-                error(f"Failed to post comment: {result.stderr}")
+    with Session(app_ctx.engine) as session:
+        if batch:
+            try:
+                ids = [int(token) for token in sys.stdin.read().split()]
+            except ValueError as e:
+                error(f"Invalid assessment ID on stdin: {e}")
+                raise typer.Exit(1)
+            if not ids:
+                error("No assessment IDs on stdin")
                 raise typer.Exit(1)
 
+            rows = session.exec(
+                stmt.where(col(JobFitAssessment.id).in_(ids)).order_by(
+                    col(JobFitAssessment.id)
+                )
+            ).all()
+            missing = set(ids) - {assessment.id for assessment, _ in rows}
+            if missing:
+                error(
+                    f"No assessment found with ID: {', '.join(map(str, sorted(missing)))}"
+                )
+                raise typer.Exit(1)
+        elif latest_for_job is not None:
+            row = session.exec(
+                stmt.where(JobFitAssessment.job_id == latest_for_job)
+                .order_by(desc(JobFitAssessment.created_at))
+                .limit(1)
+            ).first()
+            if row is None:
+                error(f"No assessments found for job ID: {latest_for_job}")
+                raise typer.Exit(1)
+            rows = [row]
+        else:
+            row = session.exec(stmt.where(JobFitAssessment.id == assessment_id)).first()
+            if row is None:
+                error(f"No assessment found with ID: {assessment_id}")
+                raise typer.Exit(1)
+            rows = [row]
+
+        # Resolve every target before posting anything
+        posts = [
+            (assessment.id, *_comment_target(assessment, job, repo, issue))
+            for assessment, job in rows
+        ]
+        bodies = [_comment_markdown(assessment, job) for assessment, job in rows]
+
+    for post_id, final_repo, final_issue in posts:
+        console.print(
+            f"[dim]Posting assessment {post_id} to {final_repo}#{final_issue}...[/dim]"
+        )
+
+    def post_comment(target: tuple[int | None, str, int], markdown: str) -> dict:
+        post_id, final_repo, final_issue = target
+        return gh_http.post(
+            f"/repos/{final_repo}/issues/{final_issue}/comments",
+            {"body": markdown},
+            f"post assessment {post_id} to {final_repo}#{final_issue}",
+        )
+
+    # The shared client is thread-safe, so comments go out over one pool;
+    # create it (and resolve the token) once before fanning out
+    gh_http.get_client()
+    failed = set()
+    with ThreadPoolExecutor(max_workers=min(MAX_POST_WORKERS, len(posts))) as pool:
+        futures = {
+            pool.submit(post_comment, target, markdown): target
+            for target, markdown in zip(posts, bodies)
+        }
+        # Report each post as it lands, so a failure never hides what went out
+        for future in as_completed(futures):
+            target = futures[future]
+            post_id, final_repo, final_issue = target
+            try:
+                posted = future.result()
+            except typer.Exit:
+                # gh_http.post has already printed the reason
+                failed.add(target)
+                continue
             console.print(
-                f"[green]✓[/green] Posted assessment to {final_repo}#{final_issue}"
+                f"[green]✓[/green] Posted assessment {post_id} to {final_repo}#{final_issue}"
             )
+            console.print(f"[dim]{posted['html_url']}[/dim]")
 
-            # Try to get the comment URL from output
-            if result.stdout.strip():
-                console.print(f"[dim]{result.stdout.strip()}[/dim]")
-
-        finally:
-            # Clean up temp file
-            Path(temp_path).unlink(missing_ok=True)
+    if failed:
+        failed_ids = ", ".join(str(target[0]) for target in posts if target in failed)
+        error(f"Failed to post assessment(s): {failed_ids}")
+        raise typer.Exit(1)
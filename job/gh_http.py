@@ -0,0 +1,66 @@
+"""Minimal GitHub REST client shared by the gh commands."""
+
+import os
+import subprocess
+from functools import lru_cache
+
+import httpx
+import typer
+
+from job.utils import error
+
+GITHUB_API_URL = "https://api.github.com"
+
+
+@lru_cache(maxsize=1)
+def _token() -> str:
+    """Get a GitHub token from $GITHUB_TOKEN or the gh CLI login (once per process)."""
+    if token := os.getenv("GITHUB_TOKEN"):
+        return token
+
+    try:
+        result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True)
+    except FileNotFoundError:
+        error("No GitHub token: set GITHUB_TOKEN or log in with the gh CLI")
+        raise typer.Exit(1)
+
+    if result.returncode != 0:
+        error(f"Failed to get GitHub token from gh: {result.stderr.strip()}")
+        raise typer.Exit(1)
+    return result.stdout.strip()
+
+
+@lru_cache(maxsize=1)
+def get_client() -> httpx.Client:
+    """Get the pooled GitHub API client, reusing one connection per process."""
+    return httpx.Client(
+        base_url=GITHUB_API_URL,
+        headers={
+            "Authorization": f"Bearer {_token()}",
+            "Accept": "application/vnd.github+json",
+        },
+        timeout=30,
+    )
+
+
+def post(path: str, payload: dict, action: str) -> dict:
+    """POST a JSON payload to the GitHub API and return the decoded response.
+
+    Args:
+        path: API path, e.g. "/repos/owner/repo/issues"
+        payload: JSON request body
+        action: Description for error messages (e.g., "create issue")
+
+    Raises:
+        typer.Exit: On network errors or a non-2xx response
+    """
+    try:
+        response = get_client().post(path, json=payload)
+    except httpx.HTTPError as e:
+        error(f"Failed to {action}: {e}")
+        raise typer.Exit(1)
+
+    if response.is_error:
+        error(f"Failed to {action}: {response.status_code} {response.text}")
+        raise typer.Exit(1)
+    return response.json()
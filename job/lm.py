@@ -1,3 +1,4 @@
+import re
 from collections import defaultdict
 from typing import get_args
 
@@ -7,6 +8,31 @@ from pydantic_ai.models import KnownModelName
 # <gateway>/<provider>:<model>
 
 console = Console()
+
+# KnownModelName is a TypeAliasType in newer versions, so we need to access __value__
+KNOWN_MODELS: tuple[str, ...] = get_args(
+    getattr(KnownModelName, "__value__", KnownModelName)
+)
+
+
+def _group_by_provider(models: tuple[str, ...]) -> dict[str, tuple[str, ...]]:
+    """Group model names by provider prefix, with providers and models sorted."""
+    by_provider = defaultdict(list)
+    for m in models:
+        provider, sep, _ = m.partition(":")
+        by_provider[provider if sep else "other"].append(m)
+    return {p: tuple(sorted(by_provider[p])) for p in sorted(by_provider)}
+
+
+# Grouped once at import; the command only filters these
+MODELS_BY_PROVIDER = _group_by_provider(KNOWN_MODELS)
+
+# Lowercased names for case-insensitive filtering, parallel to MODELS_BY_PROVIDER
+_LOWER_BY_PROVIDER = {
+    provider: tuple(m.lower() for m in models)
+    for provider, models in MODELS_BY_PROVIDER.items()
+}
+
 app = typer.Typer(
     invoke_without_command=True, help="List ai models supported by pydantic-ai"
 )
@@ -26,52 +52,37 @@ def list_models(
     List available AI models.
     """
 
-    # KnownModelName is a TypeAliasType in newer versions, so we need to access __value__
-    model_type = getattr(KnownModelName, "__value__", KnownModelName)
-    models = get_args(model_type)
+    console.print(
+        f"[bold]Found {len(KNOWN_MODELS)} known models in pydantic_ai.[/bold]\n"
+    )
 
-    # Group by provider
-    by_provider = defaultdict(list)
-    for m in models:
-        if ":" in m:
-            provider, _ = m.split(":", 1)
-            by_provider[provider].append(m)
-        else:
-            by_provider["other"].append(m)
-
-    console.print(f"[bold]Found {len(models)} known models in pydantic_ai.[/bold]\n")
-
-    include_lower = include.lower() if include else None
-    excludes_lower = [e.lower() for e in exclude] if exclude else []
-
-    for provider_key in sorted(by_provider.keys()):
-        # Filter by provider or model name (search term)
-        if include_lower:
-            candidates = [
-                m
-                for m in by_provider[provider_key]
-                if include_lower in m.lower() or include_lower in provider_key.lower()
-            ]
-        else:
-            candidates = by_provider[provider_key]
-
-        # Apply excludes
-        if excludes_lower:
-            matching_models = [
-                m
-                for m in candidates
-                if not any(ex in m.lower() for ex in excludes_lower)
-            ]
-        else:
-            matching_models = candidates
+    include_lower = include.lower() if include else ""
+    # All exclude terms in one pattern, so each model is scanned once
+    exclude_re = (
+        re.compile("|".join(re.escape(e.lower()) for e in exclude)) if exclude else None
+    )
+
+    # Collect every line and print once instead of once per model
+    lines: list[str] = []
+    for provider_key, provider_models in MODELS_BY_PROVIDER.items():
+        # Filter by provider or model name (search term), then apply excludes
+        provider_matches = not include_lower or include_lower in provider_key.lower()
+        matching_models = [
+            m
+            for m, m_lower in zip(provider_models, _LOWER_BY_PROVIDER[provider_key])
+            if (provider_matches or include_lower in m_lower)
+            and not (exclude_re and exclude_re.search(m_lower))
+        ]
 
         if not matching_models:
             continue
 
-        console.print(f"[bold cyan]--- {provider_key.upper()} ---[/bold cyan]")
-        for m in sorted(matching_models):
-            console.print(f"  {m}")
-        console.print()
+        lines.append(f"[bold cyan]--- {provider_key.upper()} ---[/bold cyan]")
+        lines.extend(f"  {m}" for m in matching_models)
+        lines.append("")
+
+    if lines:
+        console.print("\n".join(lines))
 
     console.print("[dim]Usage example:[/dim]")
     console.print("  [dim]job add https://example.com/job -s -m openai:gpt-4o[/dim]")
@@ -1,4 +1,6 @@
 # main.py
+import importlib
+import os
 from pathlib import Path
 from typing import Annotated
 
@@ -6,45 +8,104 @@ import typer
 
 from dotenv import load_dotenv
 from rich.console import Console
+from typer.core import TyperGroup
 
 from job.__version__ import __version__ as job_version
 from job.config import settings
 from job.core import AppContext
-from job.search import app as search_app
-from job.add import app as add_app
-from job.commands import app as commands_app
-from job.fit import app as fit_app
-from job.app import app as app_app
-from job.db import app as db_app
-from job.gh import app as gh_app
-from job.lm import app as lm_app
-from job.upt import app as upt_app, update
 
 console = Console()
 
 # Load environment variables
-# 1. Load system/global config first
-global_env_locations = [
-    Path.home() / ".config" / "job" / ".env",
-    Path.home() / ".job.env",
-]
-for _env_path in global_env_locations:
-    if _env_path.exists():
-        load_dotenv(_env_path)
-        break
-
-# 2. Load local config (overrides global)
-local_env = Path.cwd() / ".env"
-if local_env.exists():
-    load_dotenv(local_env, override=True)
+# An explicit JOB_ENV_FILE skips the lookup entirely
+if _env_file := os.getenv("JOB_ENV_FILE"):
+    load_dotenv(_env_file)
 else:
-    # Fallback if no specific files found above, try default behavior
-    if not any(p.exists() for p in global_env_locations):
+    # 1. Load system/global config first
+    global_env_locations = [
+        Path.home() / ".config" / "job" / ".env",
+        Path.home() / ".job.env",
+    ]
+    global_found = False
+    for _env_path in global_env_locations:
+        if _env_path.exists():
+            load_dotenv(_env_path)
+            global_found = True
+            break
+
+    # 2. Load local config (overrides global)
+    local_env = Path.cwd() / ".env"
+    if local_env.exists():
+        load_dotenv(local_env, override=True)
+    elif not global_found:
+        # Fallback if no specific files found above, try default behavior
         load_dotenv()
 
 
+# Sub-app modules are imported only when one of their commands is dispatched,
+# so e.g. `job ls` never loads the fetchers or search dependencies.
+# Command name -> module providing it, in help listing order
+SUBCOMMAND_MODULES = {
+    **dict.fromkeys(["upt", "u"], "job.upt"),
+    **dict.fromkeys(["add", "a", "add-many"], "job.add"),
+    **dict.fromkeys(["search", "s"], "job.search"),
+    **dict.fromkeys(
+        ["list", "l", "ls", "view", "v", "show", "del", "d", "rm"]
+        + ["query", "q", "find", "export", "e"],
+        "job.commands",
+    ),
+    **dict.fromkeys(["fit", "f"], "job.fit"),
+    "app": "job.app",
+    "lm": "job.lm",
+    "db": "job.db",
+    "gh": "job.gh",
+    "update": "job.upt",
+}
+
+# Modules whose commands are merged at root level for a flat command structure
+FLAT_SUBAPPS = ("job.add", "job.search", "job.commands", "job.upt")
+
+# Modules mounted as command groups: module -> [(name, hidden)]
+SUBAPP_GROUPS = {
+    "job.fit": [("fit", False), ("f", True)],
+    "job.app": [("app", False)],
+    "job.lm": [("lm", False)],
+    "job.db": [("db", False)],
+    "job.gh": [("gh", False)],
+    "job.upt": [("update", False)],
+}
+
+
+class LazyGroup(TyperGroup):
+    """Root group that imports sub-app modules on first use."""
+
+    def _load(self, module_name: str) -> None:
+        sub_app = importlib.import_module(module_name).app
+        if module_name in FLAT_SUBAPPS:
+            for name, command in typer.main.get_group(sub_app).commands.items():
+                self.add_command(command, name)
+        for name, hidden in SUBAPP_GROUPS.get(module_name, []):
+            group = typer.main.get_group(sub_app)
+            group.name = name
+            group.hidden = hidden
+            self.add_command(group, name)
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in SUBCOMMAND_MODULES:
+            self._load(SUBCOMMAND_MODULES[cmd_name])
+        return super().get_command(ctx, cmd_name)
+
+    def list_commands(self, ctx):
+        # Help and completion need every command
+        for name, module_name in SUBCOMMAND_MODULES.items():
+            if name not in self.commands:
+                self._load(module_name)
+        return [name for name in SUBCOMMAND_MODULES if name in self.commands]
+
+
 # Main CLI application instance
 app = typer.Typer(
+    cls=LazyGroup,
     invoke_without_command=True,
     no_args_is_help=True,
     context_settings={"help_option_names": ["-h", "--help"]},
@@ -78,18 +139,3 @@ def main(
     if verbose:
         settings.verbose = True
     ctx.obj = AppContext(config=settings)
-
-
-# Merge all sub-apps at root level for flat command structure
-app.add_typer(add_app)
-app.add_typer(search_app)
-app.add_typer(commands_app)
-app.add_typer(fit_app, name="fit")
-app.add_typer(fit_app, name="f", hidden=True)
-app.add_typer(app_app, name="app")
-app.add_typer(lm_app, name="lm")
-app.add_typer(db_app, name="db")
-app.add_typer(gh_app, name="gh")
-app.add_typer(upt_app, name="update")
-app.command(name="upt")(update)
-app.command(name="u", hidden=True)(update)
@@ -5,8 +5,11 @@ Career page scanning functionality with async support.
 
 import asyncio
 import re
+from collections import Counter
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 import typer
 from rich.console import Console
@@ -14,7 +17,11 @@ from rich.table import Table
 
 from job.core import AppContext
 from job.config import CareerPage, JobSearch
-from job.fetchers import AsyncBrowserFetcher, BrowserFetcher, StaticFetcher
+from job.fetchers import (
+    AsyncBrowserFetcher,
+    AsyncStaticFetcher,
+    BrowserFetcher,
+)
 from job.utils import error
 
 console = Console()
@@ -25,8 +32,11 @@ app = typer.Typer()
 # Minimum content length to consider the page loaded
 MIN_CONTENT_LENGTH = 200
 
+# Compiled keyword patterns kept per process; keywords repeat across pages
+PATTERN_CACHE_SIZE = 2048
 
-@dataclass
+
+@dataclass(slots=True)
 class SearchMatch:
     """A keyword match found on a career page."""
 
@@ -35,7 +45,7 @@ class SearchMatch:
     context_snippets: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PageScanResult:
     """Result of scanning a single career page."""
 
@@ -44,14 +54,13 @@ class PageScanResult:
     matches: list[SearchMatch] = field(default_factory=list)
     error_message: str = ""
     content_length: int = 0
+    # Derived from matches, which are final once the result is built
+    total_matches: int = field(init=False)
+    matched_keywords: list[str] = field(init=False)
 
-    @property
-    def total_matches(self) -> int:
-        return sum(m.count for m in self.matches)
-
-    @property
-    def matched_keywords(self) -> list[str]:
-        return [m.keyword for m in self.matches if m.count > 0]
+    def __post_init__(self) -> None:
+        self.total_matches = sum(m.count for m in self.matches)
+        self.matched_keywords = [m.keyword for m in self.matches if m.count > 0]
 
 
 # Common date patterns found on career pages
@@ -80,6 +89,40 @@ DATE_PATTERNS = [
     (r"\byesterday\b", "yesterday"),
 ]
 
+# Relative dates are handled before these; compiled once at import
+ABSOLUTE_DATE_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), date_format)
+    for pattern, date_format in DATE_PATTERNS
+    if date_format not in ("relative_days", "today", "yesterday")
+]
+
+DAYS_AGO_RE = re.compile(r"(\d+)\s+days?\s+ago")
+
+# Full month names and the abbreviations strptime's %b accepts
+MONTH_ABBREVIATIONS = {
+    "january": "jan",
+    "february": "feb",
+    "march": "mar",
+    "april": "apr",
+    "june": "jun",
+    "july": "jul",
+    "august": "aug",
+    "september": "sep",
+    "october": "oct",
+    "november": "nov",
+    "december": "dec",
+}
+MONTH_NAME_RE = re.compile("|".join(MONTH_ABBREVIATIONS), re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _parse_absolute_date(date_str: str, date_format: str) -> datetime | None:
+    """Parse a normalized date string; the same dates recur across snippets."""
+    try:
+        return datetime.strptime(date_str, date_format)
+    except ValueError:
+        return None
+
 
 def parse_date_from_text(text: str) -> datetime | None:
     """Try to parse a date from text using common patterns."""
@@ -92,42 +135,26 @@ def parse_date_from_text(text: str) -> datetime | None:
         return datetime.now() - timedelta(days=1)
 
     # "X days ago" pattern
-    days_ago_match = re.search(r"(\d+)\s+days?\s+ago", text_lower)
+    days_ago_match = DAYS_AGO_RE.search(text_lower)
     if days_ago_match:
         days = int(days_ago_match.group(1))
         return datetime.now() - timedelta(days=days)
 
     # Try standard date formats
-    for pattern, date_format in DATE_PATTERNS:
-        if date_format in ("relative_days", "today", "yesterday"):
-            continue  # Already handled above
-
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern, date_format in ABSOLUTE_DATE_PATTERNS:
+        match = pattern.search(text)
         if match:
-            date_str = match.group(0)
             # Normalize month names to 3-letter abbreviations for parsing
-            for full, abbr in [
-                ("january", "jan"),
-                ("february", "feb"),
-                ("march", "mar"),
-                ("april", "apr"),
-                ("june", "jun"),
-                ("july", "jul"),
-                ("august", "aug"),
-                ("september", "sep"),
-                ("october", "oct"),
-                ("november", "nov"),
-                ("december", "dec"),
-            ]:
-                date_str = re.sub(full, abbr, date_str, flags=re.IGNORECASE)
+            date_str = MONTH_NAME_RE.sub(
+                lambda m: MONTH_ABBREVIATIONS[m.group().lower()], match.group(0)
+            )
 
             # Remove comma if present
             date_str = date_str.replace(",", "")
 
-            try:
-                return datetime.strptime(date_str, date_format)
-            except ValueError:
-                continue
+            parsed = _parse_absolute_date(date_str, date_format)
+            if parsed is not None:
+                return parsed
 
     return None
 
@@ -145,8 +172,132 @@ def is_content_within_days(text: str, days: int) -> bool:
     return True
 
 
+def _is_word_char(char: str) -> bool:
+    """Whether re treats the character as part of a word."""
+    return char.isalnum() or char == "_"
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _keywords_matcher(
+    keywords: tuple[str, ...],
+) -> tuple[re.Pattern[str], list[tuple[str, ...]]]:
+    """Compile one pattern that finds every keyword in a single pass.
+
+    Each keyword gets its own group, longest first, inside a zero-width
+    lookahead so matches at overlapping offsets are all seen; find_keywords
+    drops those that start inside an earlier match of the same keyword. Only
+    one alternative can match at an offset, so each group also lists the
+    shorter keywords that are whole-word prefixes of it and match there too. A
+    leading class of the keywords' first characters lets re skip
+    non-candidate offsets in C instead of trying every alternative at each one.
+
+    Returns:
+        The pattern, and for each group the lowercased keywords it counts for
+    """
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    alternatives = "|".join(f"({re.escape(kw)})" for kw in ordered)
+    first_chars = "".join(sorted({re.escape(kw[0]) for kw in ordered}))
+    pattern = re.compile(
+        rf"(?=[{first_chars}])\b(?=(?:{alternatives})\b)", re.IGNORECASE
+    )
+
+    # Index 0 is unused so the list lines up with match.lastindex
+    credited: list[tuple[str, ...]] = [()]
+    for kw in ordered:
+        prefixes = [
+            short
+            for short in ordered
+            if len(short) < len(kw)
+            and kw.startswith(short)
+            and _is_word_char(kw[len(short) - 1]) != _is_word_char(kw[len(short)])
+        ]
+        credited.append((kw, *prefixes))
+    return pattern, credited
+
+
+def find_keywords(text: str, keywords: list[str]) -> dict[str, list[int]]:
+    """Find whole-word, case-insensitive keyword matches in one pass.
+
+    Returns:
+        Ascending match start offsets keyed by lowercased keyword
+    """
+    lowered = tuple(kw.lower() for kw in keywords if kw)
+    starts: dict[str, list[int]] = {kw: [] for kw in lowered}
+    # A plain substring check is far cheaper than the regex, so only keywords
+    # that occur somewhere in the text go on to the word-boundary pass
+    folded = text.casefold()
+    present = tuple(kw for kw in lowered if kw.casefold() in folded)
+    if not present:
+        return starts
+
+    pattern, credited = _keywords_matcher(present)
+    # The lookahead sees overlapping matches; like re.findall, a keyword only
+    # counts again once its previous match has ended
+    free_from = dict.fromkeys(present, 0)
+    for match in pattern.finditer(text):
+        offset = match.start()
+        for kw in credited[match.lastindex or 0]:
+            if offset >= free_from[kw]:
+                starts[kw].append(offset)
+                free_from[kw] = offset + len(kw)
+    return starts
+
+
+def count_keywords(text: str, keywords: list[str]) -> Counter[str]:
+    """Count whole-word, case-insensitive keyword matches in one pass.
+
+    Returns:
+        Match counts keyed by lowercased keyword
+    """
+    return Counter(
+        {kw: len(offsets) for kw, offsets in find_keywords(text, keywords).items()}
+    )
+
+
+def _context_spans(
+    text: str, starts: list[int], length: int, context_size: int
+) -> Iterator[tuple[int, int]]:
+    """Yield snippet spans around keyword matches, given their start offsets.
+
+    Gives the spans finditer would for .{0,n}\\bkeyword\\b.{0,n}: context stays
+    on the match's line, a span reaches forward to the last match starting
+    within n characters of its start, and matches inside a span's trailing
+    context are absorbed into it.
+    """
+    scan_pos = 0
+    i = 0
+    while i < len(starts):
+        first = starts[i]
+        if first < scan_pos:
+            i += 1
+            continue
+
+        start = max(scan_pos, first - context_size, text.rfind("\n", 0, first) + 1)
+        line_end = text.find("\n", first)
+        if line_end == -1:
+            line_end = len(text)
+        while (
+            i + 1 < len(starts)
+            and starts[i + 1] <= start + context_size
+            and starts[i + 1] < line_end
+        ):
+            i += 1
+
+        match_end = starts[i] + length
+        line_end = text.find("\n", match_end)
+        if line_end == -1:
+            line_end = len(text)
+        scan_pos = min(match_end + context_size, line_end)
+        yield start, scan_pos
+        i += 1
+
+
 def extract_context(
-    text: str, keyword: str, max_snippets: int = 1000, since_days: int | None = None
+    text: str,
+    keyword: str,
+    max_snippets: int = 1000,
+    since_days: int | None = None,
+    starts: list[int] | None = None,
 ) -> list[str]:
     """Extract context snippets around keyword matches.
 
@@ -155,19 +306,18 @@ def extract_context(
         keyword: The keyword to find
         max_snippets: Maximum number of snippets to return
         since_days: If set, only include snippets with dates within this many days
+        starts: Match offsets from find_keywords, to skip searching again
     """
+    if starts is None:
+        starts = find_keywords(text, [keyword]).get(keyword.lower(), [])
+
     snippets = []
     # Use wider context to capture dates
     context_size = 100 if since_days else 40
-    pattern = re.compile(
-        rf".{{0,{context_size}}}\b{re.escape(keyword)}\b.{{0,{context_size}}}",
-        re.IGNORECASE,
-    )
 
-    for match in pattern.finditer(text):
-        snippet = match.group().strip()
-        # Clean up the snippet
-        snippet = re.sub(r"\s+", " ", snippet)
+    for start, end in _context_spans(text, starts, len(keyword), context_size):
+        # Collapse whitespace runs and trim the ends in one C-level pass
+        snippet = " ".join(text[start:end].split())
 
         if snippet:
             # Filter by date if --since is specified
@@ -200,15 +350,22 @@ def search_keywords(
         since_days: If set, only include matches with dates within this many days
     """
     matches = []
-    text_lower = text.lower()
+    found = find_keywords(text, keywords)
 
+    # Case-insensitive duplicates (e.g. from --extra) are reported once, under
+    # their first spelling
+    unique: dict[str, str] = {}
     for keyword in keywords:
-        # Use word boundaries for accurate matching
-        pattern = rf"\b{re.escape(keyword.lower())}\b"
-        count = len(re.findall(pattern, text_lower))
+        unique.setdefault(keyword.lower(), keyword)
+
+    for lowered, keyword in unique.items():
+        starts = found.get(lowered, [])
+        count = len(starts)
 
         if count > 0:
-            context = extract_context(text, keyword, since_days=since_days)
+            context = extract_context(
+                text, keyword, since_days=since_days, starts=starts
+            )
             # Only add match if we have context (respects date filter)
             if context or since_days is None:
                 matches.append(
@@ -231,12 +388,10 @@ def fetch_page_content(page: CareerPage, ctx: AppContext, no_js: bool = False) -
         no_js: If True, use static fetch (faster but may miss JS-loaded content)
     """
     log = ctx.logger.bind(company=page.company)
+    static_fetcher = ctx.static_fetcher
 
     if no_js:
         log.debug("fetching_static")
-        static_fetcher = StaticFetcher(
-            timeout=ctx.config.REQUEST_TIMEOUT, logger=ctx.logger
-        )
         result = static_fetcher.fetch(page.url)
         text = result.content
         if text:
@@ -257,9 +412,6 @@ def fetch_page_content(page: CareerPage, ctx: AppContext, no_js: bool = False) -
         log.warning("browser_fetch_failed", error=str(e))
         # Fall back to static fetch as last resort
         log.debug("fallback_static_fetch")
-        static_fetcher = StaticFetcher(
-            timeout=ctx.config.REQUEST_TIMEOUT, logger=ctx.logger
-        )
         result = static_fetcher.fetch(page.url)
         text = result.content
         if text:
@@ -284,6 +436,13 @@ def scan_page(
                 success=False,
                 error_message="Failed to fetch page content",
             )
+        if len(content) < MIN_CONTENT_LENGTH:
+            # Likely an unrendered shell; nothing worth matching against
+            return PageScanResult(
+                page=page,
+                success=False,
+                error_message=f"Content too short ({len(content)} chars)",
+            )
 
         matches = search_keywords(content, keywords, since_days=since_days)
 
@@ -303,29 +462,31 @@ def scan_page(
 
 
 async def fetch_page_content_async(
-    page: CareerPage, ctx: AppContext, no_js: bool = False
+    page: CareerPage,
+    ctx: AppContext,
+    no_js: bool = False,
+    browser_fetcher: AsyncBrowserFetcher | None = None,
+    static_fetcher: AsyncStaticFetcher | None = None,
 ) -> str:
     """Async fetch content from a career page using native async playwright.
 
     Args:
         page: The career page to fetch
         ctx: Application context
-        no_js: If True, use static fetch (run in executor since requests is sync)
+        no_js: If True, use static fetch (async httpx, no browser)
+        browser_fetcher: Fetcher sharing one browser across pages; a
+            single-use one is created if not given
+        static_fetcher: Fetcher sharing one connection pool across pages; a
+            single-use one is created if not given
     """
     log = ctx.logger.bind(company=page.company)
+    static_fetcher = static_fetcher or AsyncStaticFetcher(
+        timeout=ctx.config.REQUEST_TIMEOUT, logger=ctx.logger
+    )
 
     if no_js:
-        # Static fetch - run sync requests in executor
         log.debug("fetching_static_async")
-        static_fetcher = StaticFetcher(
-            timeout=ctx.config.REQUEST_TIMEOUT, logger=ctx.logger
-        )
-
-        # Helper to run fetch and get content
-        def _fetch():
-            return static_fetcher.fetch(page.url).content
-
-        text = await asyncio.to_thread(_fetch)
+        text = (await static_fetcher.fetch(page.url)).content
         if text:
             log.debug("static_fetch_complete", chars=len(text))
         return text
@@ -333,7 +494,7 @@ async def fetch_page_content_async(
     # Browser fetch using native async playwright
     log.debug("fetching_browser_async")
     try:
-        async_fetcher = AsyncBrowserFetcher(
+        async_fetcher = browser_fetcher or AsyncBrowserFetcher(
             timeout_ms=ctx.config.PLAYWRIGHT_TIMEOUT_MS, logger=ctx.logger
         )
         result = await async_fetcher.fetch(page.url)
@@ -344,14 +505,7 @@ async def fetch_page_content_async(
         log.warning("browser_fetch_failed", error=str(e))
         # Fall back to static fetch
         log.debug("fallback_static_fetch")
-        static_fetcher = StaticFetcher(
-            timeout=ctx.config.REQUEST_TIMEOUT, logger=ctx.logger
-        )
-
-        def _fetch():
-            return static_fetcher.fetch(page.url).content
-
-        text = await asyncio.to_thread(_fetch)
+        text = (await static_fetcher.fetch(page.url)).content
         if text:
             log.debug("static_fetch_complete", chars=len(text))
         return text
@@ -363,10 +517,18 @@ async def scan_page_async(
     ctx: AppContext,
     no_js: bool = False,
     since_days: int | None = None,
+    browser_fetcher: AsyncBrowserFetcher | None = None,
+    static_fetcher: AsyncStaticFetcher | None = None,
 ) -> PageScanResult:
     """Async scan a single career page for keywords using native async."""
     try:
-        content = await fetch_page_content_async(page, ctx, no_js=no_js)
+        content = await fetch_page_content_async(
+            page,
+            ctx,
+            no_js=no_js,
+            browser_fetcher=browser_fetcher,
+            static_fetcher=static_fetcher,
+        )
 
         if not content:
             return PageScanResult(
@@ -374,8 +536,18 @@ async def scan_page_async(
                 success=False,
                 error_message="Failed to fetch page content",
             )
+        if len(content) < MIN_CONTENT_LENGTH:
+            # Likely an unrendered shell; nothing worth matching against
+            return PageScanResult(
+                page=page,
+                success=False,
+                error_message=f"Content too short ({len(content)} chars)",
+            )
 
-        matches = search_keywords(content, keywords, since_days=since_days)
+        # In a worker thread so the event loop keeps driving other fetches
+        matches = await asyncio.to_thread(
+            search_keywords, content, keywords, since_days=since_days
+        )
 
         return PageScanResult(
             page=page,
@@ -397,15 +569,65 @@ async def scan_all_pages_async(
     ctx: AppContext,
     no_js: bool = False,
     since_days: int | None = None,
+    on_result: Callable[[PageScanResult], None] | None = None,
 ) -> list[PageScanResult]:
-    """Scan all enabled pages concurrently using native async."""
-    tasks = [
-        scan_page_async(
-            page, search_settings.get_keywords_for_page(page), ctx, no_js, since_days
+    """Scan all enabled pages concurrently using native async.
+
+    on_result, if given, is called with each result as soon as its page is
+    done; the returned list is in page order.
+    """
+    # Caps how many pages (and so browser contexts) are in flight at once
+    semaphore = asyncio.Semaphore(search_settings.concurrency)
+
+    # One browser for the whole scan, launched by the first browser fetch, and
+    # one connection pool for static fetches and fallbacks
+    async with (
+        AsyncBrowserFetcher(
+            timeout_ms=ctx.config.PLAYWRIGHT_TIMEOUT_MS, logger=ctx.logger
+        ) as browser_fetcher,
+        AsyncStaticFetcher(
+            timeout=ctx.config.REQUEST_TIMEOUT, logger=ctx.logger
+        ) as static_fetcher,
+    ):
+
+        async def scan(page: CareerPage) -> PageScanResult:
+            async with semaphore:
+                result = await scan_page_async(
+                    page,
+                    search_settings.get_keywords_for_page(page),
+                    ctx,
+                    no_js,
+                    since_days,
+                    browser_fetcher,
+                    static_fetcher,
+                )
+            if on_result is not None:
+                on_result(result)
+            return result
+
+        return await asyncio.gather(
+            *(scan(page) for page in search_settings.enabled_pages)
         )
-        for page in search_settings.enabled_pages
-    ]
-    return await asyncio.gather(*tasks)
+
+
+def print_page_matches(result: PageScanResult) -> None:
+    """Print each snippet found on a page, then the page's match summary."""
+    page = result.page
+    positions_found = 0
+    for match in result.matches:
+        for snippet in match.context_snippets:
+            positions_found += 1
+            clean_snippet = snippet.strip(".")
+            console.print(
+                f"  [green]Found[/green] [yellow]{match.keyword}[/yellow] "
+                f"in [link={page.url}][cyan]{clean_snippet}[/cyan][/link]"
+            )
+    if positions_found > 0:
+        console.print(
+            f"  [bold]{positions_found} position(s) found in {page.company}[/bold]"
+        )
+    elif result.success:
+        console.print(f"  [dim]No matches in {page.company}[/dim]")
 
 
 def display_results(results: list[PageScanResult], verbose: bool = False) -> None:
@@ -420,10 +642,12 @@ def display_results(results: list[PageScanResult], verbose: bool = False) -> Non
     for result in results:
         if result.success:
             status = "✅"
-            match_count = str(result.total_matches) if result.total_matches else "-"
-            keywords_str = ", ".join(result.matched_keywords[:5])
-            if len(result.matched_keywords) > 5:
-                keywords_str += f" (+{len(result.matched_keywords) - 5})"
+            total = result.total_matches
+            matched = result.matched_keywords
+            match_count = str(total) if total else "-"
+            keywords_str = ", ".join(matched[:5])
+            if len(matched) > 5:
+                keywords_str += f" (+{len(matched) - 5})"
         else:
             status = f"❌ {result.error_message[:30]}"
             match_count = "-"
@@ -441,17 +665,20 @@ def display_results(results: list[PageScanResult], verbose: bool = False) -> Non
         console.print("[bold]🔎 Detailed Matches[/bold]")
         console.print()
 
+        # One print per company, so Rich parses and renders each block once
         for result in interesting_results:
-            console.print(
+            lines = [
                 f"[bold cyan]{result.page.company}[/bold cyan] ({result.page.url})"
-            )
+            ]
             for match in result.matches:
-                console.print(
+                lines.append(
                     f"  • [yellow]{match.keyword}[/yellow]: {match.count} occurrences"
                 )
-                for snippet in match.context_snippets:
-                    console.print(f"    [dim]{snippet}[/dim]")
-            console.print()
+                lines.extend(
+                    f"    [dim]{snippet}[/dim]" for snippet in match.context_snippets
+                )
+            lines.append("")
+            console.print("\n".join(lines))
 
 
 # -------------------------
@@ -535,11 +762,13 @@ def search_pages(
 
     # Filter to specific pages if requested
     if companies:
-        matching_pages = [
-            p
-            for p in search_config.enabled_pages
-            if any(c.lower() in p.company.lower() for c in companies)
-        ]
+        # Lowercase each name once, not once per comparison
+        wanted = [c.lower() for c in companies]
+        matching_pages = []
+        for p in search_config.enabled_pages:
+            company = p.company.lower()
+            if any(w in company for w in wanted):
+                matching_pages.append(p)
         if not matching_pages:
             error(f"No pages found matching: {', '.join(companies)}")
             console.print("[dim]Available companies:[/dim]")
@@ -576,30 +805,18 @@ def search_pages(
     try:
         # Scan pages (parallel or sequential)
         if final_parallel:
+
+            def on_result(result: PageScanResult) -> None:
+                console.print(f"[bold]Searching in {result.page.company}...[/bold]")
+                print_page_matches(result)
+
+            # Pages print as they finish; results keep the configured order
             with console.status("[bold]Searching all pages in parallel...[/bold]"):
                 results = asyncio.run(
-                    scan_all_pages_async(search_config, app_ctx, no_js, final_since)
-                )
-
-            # Print matches after parallel scan completes
-            for result in results:
-                page = result.page
-                console.print(f"[bold]Searching in {page.company}...[/bold]")
-                positions_found = 0
-                for match in result.matches:
-                    for snippet in match.context_snippets:
-                        positions_found += 1
-                        clean_snippet = snippet.strip(".")
-                        console.print(
-                            f"  [green]Found[/green] [yellow]{match.keyword}[/yellow] "
-                            f"in [link={page.url}][cyan]{clean_snippet}[/cyan][/link]"
-                        )
-                if positions_found > 0:
-                    console.print(
-                        f"  [bold]{positions_found} position(s) found in {page.company}[/bold]"
+                    scan_all_pages_async(
+                        search_config, app_ctx, no_js, final_since, on_result
                     )
-                elif result.success:
-                    console.print(f"  [dim]No matches in {page.company}[/dim]")
+                )
         else:
             results = []
             total_pages = len(pages_to_scan)
@@ -619,21 +836,7 @@ def search_pages(
                     results.append(result)
 
                 # Print matches after fetching
-                positions_found = 0
-                for match in result.matches:
-                    for snippet in match.context_snippets:
-                        positions_found += 1
-                        clean_snippet = snippet.strip(".")
-                        console.print(
-                            f"  [green]Found[/green] [yellow]{match.keyword}[/yellow] "
-                            f"in [link={page.url}][cyan]{clean_snippet}[/cyan][/link]"
-                        )
-                if positions_found > 0:
-                    console.print(
-                        f"  [bold]{positions_found} position(s) found in {page.company}[/bold]"
-                    )
-                elif result.success:
-                    console.print(f"  [dim]No matches in {page.company}[/dim]")
+                print_page_matches(result)
 
         # Display results
         display_results(results, verbose=verbose)
@@ -100,7 +100,6 @@ def update(
         setattr(job, field, processed_value)
         session.add(job)
         session.commit()
-        session.refresh(job)
 
         # Display the change
         console.print(f"[green]✓[/green] Updated job {job_id}:")
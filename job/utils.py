@@ -1,52 +1,103 @@
-import json
+import codecs
+import io
+import re
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 from urllib.parse import urlparse
 
 import typer
 from pydantic import ValidationError
-from pydantic_ai.exceptions import ModelRetry, UnexpectedModelBehavior
 from rich.console import Console
-from sqlmodel import Session
+
+if TYPE_CHECKING:
+    from sqlmodel import Session
 
 # Date/time format constant
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-console = Console()
+# Upper bound on threads used to read context files concurrently
+MAX_READ_WORKERS = 16
+
+# Leading bytes decoded to tell text from binary before a full read
+TEXT_PROBE_BYTES = 4096
+
+# Context file suffixes that are never UTF-8 text, skipped without reading
+BINARY_EXTENSIONS = frozenset(
+    {".pdf", ".doc", ".docx", ".odt", ".png", ".jpg", ".jpeg", ".gif", ".zip"}
+)
+
+# URL schemes accepted by validate_url
+URL_SCHEMES = frozenset({"http", "https"})
+
+# Common well-formed http(s) URLs, accepted without running urlparse
+_URL_FAST = re.compile(r"^https?://[A-Za-z0-9.\-]+\.[A-Za-z]{2,}(?::\d+)?(/.*)?$")
 
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=1)
+def _console() -> Console:
+    """Create the console on first use, so terminal detection runs lazily."""
+    return Console()
+
+
 def error(message: str) -> None:
     """Print an error message to stderr."""
     typer.echo(f"Error: {message}", err=True)
 
 
-def validate_url(url: str) -> str:
-    """Validate and normalize a URL. Raises typer.Exit on invalid URL."""
+@lru_cache(maxsize=512)
+def _check_url(url: str) -> tuple[str, str | None]:
+    """Normalize a URL, returning it with an error message if it is invalid."""
     url = url.strip()
 
     # Add scheme if missing
     if not url.startswith(("http://", "https://")):
         url = f"https://{url}"
 
+    if _URL_FAST.match(url):
+        return url, None
+
     try:
         parsed = urlparse(url)
-        if not parsed.netloc:
-            error(f"Invalid URL: missing domain in '{url}'")
-            raise typer.Exit(1)
-        if parsed.scheme not in ("http", "https"):
-            error(f"Invalid URL scheme: '{parsed.scheme}' (must be http or https)")
-            raise typer.Exit(1)
-        # Check for valid domain (must have a dot for TLD, unless localhost)
-        if "." not in parsed.netloc and "localhost" not in parsed.netloc.lower():
-            error(f"Invalid domain: '{parsed.netloc}' (missing TLD)")
-            raise typer.Exit(1)
-        return url
     except ValueError as e:
-        error(f"Invalid URL format: {e}")
+        return url, f"Invalid URL format: {e}"
+    if not parsed.netloc:
+        return url, f"Invalid URL: missing domain in '{url}'"
+    if parsed.scheme not in URL_SCHEMES:
+        return url, f"Invalid URL scheme: '{parsed.scheme}' (must be http or https)"
+    # Check for valid domain (must have a dot for TLD, unless localhost)
+    if "." not in parsed.netloc and "localhost" not in parsed.netloc.lower():
+        return url, f"Invalid domain: '{parsed.netloc}' (missing TLD)"
+    return url, None
+
+
+def validate_url(url: str) -> str:
+    """Validate and normalize a URL. Raises typer.Exit on invalid URL."""
+    url, message = _check_url(url)
+    if message is not None:
+        error(message)
         raise typer.Exit(1)
+    return url
+
+
+def _read_text_bytes(path: Path) -> bytes:
+    """Read a file's bytes, giving up early if it does not start as UTF-8.
+
+    Raises:
+        UnicodeDecodeError: If the first TEXT_PROBE_BYTES are not valid UTF-8
+    """
+    with path.open("rb") as f:
+        head = f.read(TEXT_PROBE_BYTES)
+        # Incremental, so a character split at the probe boundary is not an error
+        codecs.getincrementaldecoder("utf-8")().decode(head)
+        if len(head) < TEXT_PROBE_BYTES:
+            return head
+        return head + f.read()
 
 
 def read_context_files(
@@ -64,51 +115,75 @@ def read_context_files(
     Raises:
         typer.Exit: If any path cannot be read
     """
-    combined_content = []
-    valid_paths = []
-
+    paths = []
+    # Resolved once; joining onto it leaves absolute paths unchanged
+    cwd = Path.cwd()
     for path_str in context_paths:
         path = Path(path_str).expanduser()
 
-        if not path.exists():
+        # One stat call covers both the existence and the regular-file check
+        try:
+            mode = path.stat().st_mode
+        except OSError:
             error(f"File not found: {path}")
             raise typer.Exit(1)
 
-        if not path.is_file():
+        if not stat.S_ISREG(mode):
             error(f"Path is not a file: {path}")
             raise typer.Exit(1)
 
-        try:
-            content = path.read_text(encoding="utf-8")
-            combined_content.append(f"=== {path.name} ===\n{content}\n")
-            valid_paths.append(str(path.absolute()))
-        except UnicodeDecodeError:
-            console.print(
+        if path.suffix.lower() in BINARY_EXTENSIONS:
+            _console().print(
                 f"[dim]Skipped binary file: {path.name}[/dim]", style="yellow"
             )
             continue
-        except Exception as e:
-            error(f"Failed to read {path}: {e}")
-            raise typer.Exit(1)
 
-    result = "\n".join(combined_content)
+        paths.append(path)
+
+    # Files are written straight into one buffer rather than joined at the end
+    combined = io.StringIO()
+    valid_paths = []
+
+    # Overlap the read syscalls; decoding happens in order below
+    with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(paths) or 1)) as pool:
+        futures = [pool.submit(_read_text_bytes, path) for path in paths]
+
+        for path, future in zip(paths, futures):
+            try:
+                content = future.result().decode("utf-8")
+                if valid_paths:
+                    combined.write("\n")
+                combined.write(f"=== {path.name} ===\n")
+                combined.write(content)
+                combined.write("\n")
+                valid_paths.append(str(cwd / path))
+            except UnicodeDecodeError:
+                _console().print(
+                    f"[dim]Skipped binary file: {path.name}[/dim]", style="yellow"
+                )
+                continue
+            except Exception as e:
+                error(f"Failed to read {path}: {e}")
+                raise typer.Exit(1)
+
+    result = combined.getvalue()
     if return_paths:
         return result, valid_paths
     return result
 
 
-def parse_json_or_list(value: list | str) -> list:
-    """Parse a value that might be a list or JSON string.
+# Fit score buckets from best to worst: (style, label, table color)
+SCORE_BUCKETS = (
+    ("bold green", "EXCELLENT MATCH", "green"),
+    ("bold yellow", "GOOD MATCH", "yellow"),
+    ("bold orange", "MODERATE MATCH", "orange1"),
+    ("bold red", "POOR MATCH", "red"),
+)
 
-    Args:
-        value: Either a list or a JSON-encoded string
 
-    Returns:
-        The parsed list
-    """
-    if isinstance(value, list):
-        return value
-    return json.loads(value)
+def _score_bucket(score: int) -> tuple[str, str, str]:
+    """Look up the SCORE_BUCKETS entry for a fit score (thresholds 80/60/40)."""
+    return SCORE_BUCKETS[3 - (score >= 40) - (score >= 60) - (score >= 80)]
 
 
 def get_score_style(score: int) -> tuple[str, str]:
@@ -120,14 +195,8 @@ def get_score_style(score: int) -> tuple[str, str]:
     Returns:
         Tuple of (style, label) for rich formatting
     """
-    if score >= 80:
-        return "bold green", "EXCELLENT MATCH"
-    elif score >= 60:
-        return "bold yellow", "GOOD MATCH"
-    elif score >= 40:
-        return "bold orange", "MODERATE MATCH"
-    else:
-        return "bold red", "POOR MATCH"
+    style, label, _ = _score_bucket(score)
+    return style, label
 
 
 def get_score_color(score: int) -> str:
@@ -139,14 +208,7 @@ def get_score_color(score: int) -> str:
     Returns:
         Color name for rich formatting
     """
-    if score >= 80:
-        return "green"
-    elif score >= 60:
-        return "yellow"
-    elif score >= 40:
-        return "orange1"
-    else:
-        return "red"
+    return _score_bucket(score)[2]
 
 
 @contextmanager
@@ -159,6 +221,9 @@ def handle_ai_errors(operation: str):
     Raises:
         typer.Exit: On any AI-related error
     """
+    # Deferred: pydantic_ai is slow to import and only AI commands need it
+    from pydantic_ai.exceptions import ModelRetry, UnexpectedModelBehavior
+
     try:
         yield
     except ValidationError as e:
@@ -175,7 +240,7 @@ def handle_ai_errors(operation: str):
         raise typer.Exit(1)
 
 
-def get_or_exit(session: Session, model_class: type[T], id: int, name: str) -> T:
+def get_or_exit(session: "Session", model_class: type[T], id: int, name: str) -> T:
     """Get an entity by ID or exit with error.
 
     Args:
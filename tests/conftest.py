@@ -2,7 +2,8 @@
 
 import pytest
 from pathlib import Path
-from sqlmodel import Session, SQLModel
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
 
 from job.core import AppContext, Settings, JobAd
 
@@ -29,17 +30,30 @@ def app_context(test_config: Settings) -> AppContext:
     return AppContext(config=test_config)
 
 
-@pytest.fixture
-def db_session(app_context: AppContext):
-    """Provide a database session for testing."""
-    # Create tables
-    SQLModel.metadata.create_all(app_context.engine)
+@pytest.fixture(scope="session")
+def db_engine():
+    """Provide one in-memory database engine, with tables created once."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
 
-    with Session(app_context.engine) as session:
-        yield session
 
-    # Cleanup
-    SQLModel.metadata.drop_all(app_context.engine)
+@pytest.fixture
+def db_session(db_engine):
+    """Provide a database session whose changes are rolled back after the test."""
+    with db_engine.connect() as connection:
+        transaction = connection.begin()
+        # Commits inside the test only release a savepoint
+        with Session(
+            bind=connection, join_transaction_mode="create_savepoint"
+        ) as session:
+            yield session
+        transaction.rollback()
 
 
 @pytest.fixture
@@ -120,3 +120,16 @@ def test_apply_draft_to_files(mock_write):
     )
     _apply_draft_to_files(draft)
     assert mock_write.call_count == 2
+
+
+def test_read_context_files_skips_binary_suffix(tmp_path):
+    """Test that known binary formats are skipped without being read."""
+    cv = tmp_path / "cv.md"
+    cv.write_text("CV text")
+    pdf = tmp_path / "cv.pdf"
+    pdf.write_text("looks like text but is a pdf")
+
+    content, paths = read_context_files([str(cv), str(pdf)], return_paths=True)
+    assert "CV text" in content
+    assert "pdf" not in content
+    assert paths == [str(cv.absolute())]
@@ -1,21 +1,28 @@
-from typer.testing import CliRunner
-from sqlmodel import Session, SQLModel
+import json
+from unittest.mock import patch
+
+import httpx
+import typer
+from click.testing import CliRunner
+from sqlalchemy import event
+from sqlmodel import Session, SQLModel, create_engine, select
 from job.main import app
-from job.core import JobAd
-import os
+from job import gh_http
+from job.core import JobAd, JobFitAssessment
+from job.fetchers.base import MAX_CONTENT_CHARS, FetchResult
 import pytest
 
 runner = CliRunner()
+# Built once: typer's runner would rebuild the command tree on every invoke
+cli = typer.main.get_command(app)
 
 
 @pytest.fixture
-def test_db_env(tmp_path):
+def test_db_env(tmp_path, monkeypatch):
     """Set JOB_DB_PATH to a lookup in a temporary directory."""
     db_path = tmp_path / "test_commands.db"
-    os.environ["JOB_DB_PATH"] = str(db_path)
-    yield db_path
-    if "JOB_DB_PATH" in os.environ:
-        del os.environ["JOB_DB_PATH"]
+    monkeypatch.setenv("JOB_DB_PATH", str(db_path))
+    return db_path
 
 
 @pytest.fixture
@@ -24,9 +31,14 @@ def prepopulated_db(test_db_env):
     # We need to manually initialize the engine because the app creates it
     # based on the config which reads the env var we just set.
     # However, for prepopulating, we can just use the path directly with sqlmodel.
-    from sqlmodel import create_engine
-
     engine = create_engine(f"sqlite:///{test_db_env}")
+
+    @event.listens_for(engine, "connect")
+    def _skip_fsync(dbapi_connection, connection_record):
+        # Throwaway file: no need for a durable journal while seeding it
+        dbapi_connection.execute("PRAGMA journal_mode=MEMORY")
+        dbapi_connection.execute("PRAGMA synchronous=OFF")
+
     SQLModel.metadata.create_all(engine)
 
     with Session(engine) as session:
@@ -50,14 +62,55 @@ def prepopulated_db(test_db_env):
             hiring_manager="Man B",
             full_ad="Ad Content 2",
         )
-        session.add(job1)
-        session.add(job2)
+        # One flush inserts both rows in a single batched statement
+        session.add_all([job1, job2])
         session.commit()
+    engine.dispose()
     return test_db_env
 
 
+@pytest.fixture
+def fit_assessments(prepopulated_db):
+    """Seed stored fit assessments for job 1; IDs count up from 1."""
+
+    def seed(count):
+        engine = create_engine(f"sqlite:///{prepopulated_db}")
+        with Session(engine) as session:
+            session.add_all(
+                JobFitAssessment(
+                    job_id=1,
+                    model_name="test",
+                    context_file_paths=json.dumps(["cv.md"]),
+                    overall_fit_score=70,
+                    fit_summary=f"Summary {i}",
+                    strengths=json.dumps(["Python"]),
+                    gaps=json.dumps(["Go"]),
+                    recommendations="",
+                    key_insights="",
+                )
+                for i in range(count)
+            )
+            session.commit()
+        engine.dispose()
+
+    return seed
+
+
+@pytest.fixture
+def github_api(monkeypatch):
+    """Route GitHub API calls to a request handler given by the test."""
+
+    def serve(handler):
+        client = httpx.Client(
+            base_url=gh_http.GITHUB_API_URL, transport=httpx.MockTransport(handler)
+        )
+        monkeypatch.setattr(gh_http, "get_client", lambda: client)
+
+    return serve
+
+
 def test_ls_shows_ids(prepopulated_db):
-    result = runner.invoke(app, ["ls"])
+    result = runner.invoke(cli, ["ls"])
     assert result.exit_code == 0
     assert "ID" in result.output
     assert "Job One" in result.output
@@ -68,44 +121,192 @@ def test_ls_shows_ids(prepopulated_db):
 
 
 def test_view_by_id(prepopulated_db):
-    result = runner.invoke(app, ["view", "1", "--json"])
+    result = runner.invoke(cli, ["view", "1", "--json"])
     assert result.exit_code == 0
     assert "Job One" in result.output
     assert "https://example.com/1" in result.output
 
 
 def test_view_by_url(prepopulated_db):
-    result = runner.invoke(app, ["view", "https://example.com/2", "--json"])
+    result = runner.invoke(cli, ["view", "https://example.com/2", "--json"])
     assert result.exit_code == 0
     assert "Job Two" in result.output
 
 
 def test_del_by_id(prepopulated_db):
     # Remove job 1
-    result = runner.invoke(app, ["del", "1"])
+    result = runner.invoke(cli, ["del", "1"])
     assert result.exit_code == 0
     assert "Deleted job 1" in result.output
 
     # Verify gone
-    result = runner.invoke(app, ["list"])
+    result = runner.invoke(cli, ["list"])
     assert "Job One" not in result.output
     assert "Job Two" in result.output
 
 
 def test_export_by_id(prepopulated_db):
-    result = runner.invoke(app, ["export", "2"])
+    result = runner.invoke(cli, ["export", "2"])
     assert result.exit_code == 0
     assert "Job Two" in result.output
     assert "Job One" not in result.output
 
 
 def test_export_invalid_id(prepopulated_db):
-    result = runner.invoke(app, ["export", "999"])
+    result = runner.invoke(cli, ["export", "999"])
     assert result.exit_code == 1
     assert "No job found" in result.output
 
 
 def test_app_list_no_drafts(prepopulated_db):
-    result = runner.invoke(app, ["app", "list"])
+    result = runner.invoke(cli, ["app", "list"])
     assert result.exit_code == 0
     assert "No application drafts found" in result.output
+
+
+def test_fit_view_no_assessments(prepopulated_db):
+    result = runner.invoke(cli, ["fit", "view", "1"])
+    assert result.exit_code == 1
+    assert "No fit assessments found" in result.output
+
+
+def test_fit_view_unknown_job(prepopulated_db):
+    result = runner.invoke(cli, ["fit", "view", "999", "-i", "1"])
+    assert result.exit_code == 1
+    assert "No job found" in result.output
+
+
+def test_fit_run_reuses_identical_assessment(prepopulated_db, tmp_path):
+    cv = tmp_path / "cv.md"
+    cv.write_text("Python developer")
+    args = ["fit", "run", "1", "--cv", str(cv), "-m", "test"]
+
+    first = runner.invoke(cli, args)
+    assert first.exit_code == 0
+    assert "Reusing assessment" not in first.output
+
+    second = runner.invoke(cli, args)
+    assert second.exit_code == 0
+    assert "Reusing assessment 1" in second.output
+
+    forced = runner.invoke(cli, [*args, "--force"])
+    assert forced.exit_code == 0
+    assert "Assessment ID: 2" in forced.output
+
+
+def test_gh_issue_records_issue_metadata(prepopulated_db, github_api):
+    def handler(request):
+        assert request.url.path == "/repos/owner/repo/issues"
+        return httpx.Response(
+            201,
+            json={"number": 7, "html_url": "https://github.com/owner/repo/issues/7"},
+        )
+
+    github_api(handler)
+    result = runner.invoke(cli, ["gh", "issue", "-f", "1", "--repo", "owner/repo"])
+    assert result.exit_code == 0
+    assert "owner/repo#7" in result.output
+
+    again = runner.invoke(cli, ["gh", "issue", "-f", "1", "--repo", "owner/repo"])
+    assert again.exit_code == 1
+    assert "already posted to owner/repo#7" in again.output
+
+
+def test_gh_comment_latest_and_batch(fit_assessments, github_api):
+    fit_assessments(2)
+
+    bodies = []
+
+    def handler(request):
+        assert request.url.path == "/repos/owner/repo/issues/7/comments"
+        bodies.append(json.loads(request.content)["body"])
+        return httpx.Response(
+            201, json={"html_url": f"https://github.com/c/{len(bodies)}"}
+        )
+
+    github_api(handler)
+    target = ["--repo", "owner/repo", "--issue", "7"]
+    latest = runner.invoke(cli, ["gh", "comment", "-j", "1", *target])
+    assert latest.exit_code == 0
+    assert "**Assessment ID:** 2" in bodies[0]
+
+    batch = runner.invoke(cli, ["gh", "comment", "--batch", *target], input="1 2\n")
+    assert batch.exit_code == 0
+    assert len(bodies) == 3
+
+    missing = runner.invoke(cli, ["gh", "comment", "--batch", *target], input="9")
+    assert missing.exit_code == 1
+    assert "No assessment found with ID: 9" in missing.output
+
+
+def test_gh_comment_batch_reports_partial_failure(fit_assessments, github_api):
+    fit_assessments(3)
+
+    def handler(request):
+        if "**Assessment ID:** 3" in json.loads(request.content)["body"]:
+            return httpx.Response(502, text="Bad Gateway")
+        return httpx.Response(201, json={"html_url": "https://github.com/c/1"})
+
+    github_api(handler)
+    target = ["--repo", "owner/repo", "--issue", "7"]
+    result = runner.invoke(cli, ["gh", "comment", "--batch", *target], input="1 2 3")
+    assert result.exit_code == 1
+    assert "Posted assessment 1 to owner/repo#7" in result.output
+    assert "Posted assessment 2 to owner/repo#7" in result.output
+    assert "Failed to post assessment 3 to owner/repo#7: 502" in result.output
+    assert "Failed to post assessment(s): 3" in result.output
+
+
+def test_add_structured_skips_unchanged_page(test_db_env):
+    args = ["add", "https://example.com/3", "-s", "-m", "test"]
+    page = FetchResult(content="Python developer wanted", title="Dev")
+    with patch("job.add.fetch_job_text", return_value=page):
+        first = runner.invoke(cli, args)
+        assert first.exit_code == 0
+        assert "Job saved" in first.output
+
+        second = runner.invoke(cli, args)
+        assert second.exit_code == 0
+        assert "Job 1 unchanged" in second.output
+
+        forced = runner.invoke(cli, [*args, "--force"])
+        assert forced.exit_code == 0
+        assert "Job updated" in forced.output
+
+
+def test_add_stores_full_page_text(test_db_env):
+    """A plain add keeps the whole page, past <main> and MAX_CONTENT_CHARS."""
+    body = "x" * (MAX_CONTENT_CHARS + 10_000)
+    with patch("job.fetchers.static._SESSION.get") as mock_get:
+        mock_get.return_value.text = (
+            f"<html><body><main>{body}</main><footer>Apply at example.com</footer>"
+            "</body></html>"
+        )
+        mock_get.return_value.headers = {}
+        result = runner.invoke(cli, ["add", "https://example.com/3"])
+    assert result.exit_code == 0
+
+    engine = create_engine(f"sqlite:///{test_db_env}")
+    with Session(engine) as session:
+        job = session.exec(select(JobAd)).one()
+    engine.dispose()
+    assert job.full_ad == f"{body}\nApply at example.com"
+    assert job.content_sha256 is None
+
+
+def test_add_many_extracts_once_and_skips_unchanged(test_db_env, tmp_path):
+    urls = tmp_path / "urls.txt"
+    urls.write_text("# batch\nhttps://example.com/3\nhttps://example.com/3\n")
+    args = ["add-many", str(urls), "-m", "test"]
+
+    with patch("job.fetchers.static._SESSION.get") as mock_get:
+        mock_get.return_value.text = "<html><body>Python developer</body></html>"
+        mock_get.return_value.headers = {}
+        first = runner.invoke(cli, args)
+        assert first.exit_code == 0
+        assert "Job 1 saved" in first.output
+        mock_get.assert_called_once()
+
+        second = runner.invoke(cli, args)
+        assert second.exit_code == 0
+        assert "Job 1 unchanged: https://example.com/3" in second.output
@@ -1,18 +1,20 @@
 """Tests for page fetchers."""
 
+import asyncio
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 import requests
 
-from job.fetchers import StaticFetcher
+from job.fetchers import AsyncStaticFetcher, StaticFetcher
 
 
 def test_static_fetcher_success():
     """Test successful static page fetch."""
     fetcher = StaticFetcher(timeout=5)
 
-    with patch("requests.get") as mock_get:
+    with patch("job.fetchers.static._SESSION.get") as mock_get:
         mock_response = Mock()
         mock_response.text = "<html><body>Test content</body></html>"
         mock_response.raise_for_status = Mock()
@@ -28,7 +30,7 @@ def test_static_fetcher_extracts_title():
     """Test that static fetcher accurately extracts page title."""
     fetcher = StaticFetcher(timeout=5)
 
-    with patch("requests.get") as mock_get:
+    with patch("job.fetchers.static._SESSION.get") as mock_get:
         mock_response = Mock()
         mock_response.text = "<html><head><title>My Awesome Job</title></head><body>Content</body></html>"
         mock_response.raise_for_status = Mock()
@@ -49,7 +51,7 @@ def test_static_fetcher_timeout():
 
     fetcher = StaticFetcher(timeout=5, logger=mock_logger)
 
-    with patch("requests.get", side_effect=requests.Timeout):
+    with patch("job.fetchers.static._SESSION.get", side_effect=requests.Timeout):
         with pytest.raises(requests.Timeout):
             fetcher.fetch("https://example.com")
 
@@ -61,6 +63,113 @@ def test_static_fetcher_request_error():
     """Test static fetcher error handling."""
     fetcher = StaticFetcher(timeout=5)
 
-    with patch("requests.get", side_effect=requests.RequestException("Network error")):
+    with patch(
+        "job.fetchers.static._SESSION.get",
+        side_effect=requests.RequestException("Network error"),
+    ):
         with pytest.raises(requests.RequestException):
             fetcher.fetch("https://example.com")
+
+
+def test_static_fetcher_conditional_get():
+    """Test that stored validators are sent and a 304 is reported."""
+    fetcher = StaticFetcher(timeout=5)
+
+    with patch("job.fetchers.static._SESSION.get") as mock_get:
+        mock_response = Mock()
+        mock_response.text = "<html><body>Content</body></html>"
+        mock_response.status_code = 200
+        mock_response.headers = {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024"}
+        mock_get.return_value = mock_response
+
+        result = fetcher.fetch("https://example.com")
+        assert result.etag == '"v1"'
+        assert result.last_modified == "Mon, 01 Jan 2024"
+        assert not result.not_modified
+
+        mock_response.status_code = 304
+        result = fetcher.fetch(
+            "https://example.com", etag='"v1"', last_modified="Mon, 01 Jan 2024"
+        )
+        assert result.not_modified
+        assert result.content == ""
+        assert mock_get.call_args.kwargs["headers"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024",
+        }
+
+
+def test_static_fetcher_prefers_main_content():
+    """Test that scripts and page chrome are dropped only when asked."""
+    fetcher = StaticFetcher(timeout=5)
+
+    with patch("job.fetchers.static._SESSION.get") as mock_get:
+        mock_response = Mock()
+        mock_response.text = (
+            "<html><body><nav>Home</nav><script>var x = 1;</script>"
+            "<main>Job details</main><footer>Contact</footer></body></html>"
+        )
+        mock_get.return_value = mock_response
+
+        result = fetcher.fetch("https://example.com", main_content=True)
+
+        assert result.content == "Job details"
+
+        # Without the opt-in, the whole body is kept
+        result = fetcher.fetch("https://example.com")
+
+        assert result.content == "Home\nJob details\nContact"
+
+
+def test_async_static_fetcher_shares_client():
+    """Test that fetches inside the context manager reuse one client."""
+    seen_clients = []
+
+    async def fake_get(self, url):
+        seen_clients.append(self)
+        return httpx.Response(
+            200,
+            text="<html><head><title>Jobs</title></head><body>Openings</body></html>",
+            request=httpx.Request("GET", url),
+        )
+
+    async def scan():
+        async with AsyncStaticFetcher(timeout=5) as fetcher:
+            return await asyncio.gather(
+                fetcher.fetch("https://example.com/a"),
+                fetcher.fetch("https://example.com/b"),
+            )
+
+    with patch("httpx.AsyncClient.get", fake_get):
+        results = asyncio.run(scan())
+
+    assert [r.content for r in results] == ["Openings", "Openings"]
+    assert results[0].title == "Jobs"
+    assert seen_clients[0] is seen_clients[1]
+
+
+def test_async_static_fetcher_concurrent_single_use_fetches():
+    """Test that concurrent fetches without the context manager don't share a client."""
+    seen_clients = []
+
+    async def fake_get(self, url):
+        seen_clients.append(self)
+        # The first fetch finishes (and closes its client) while the other waits
+        await asyncio.sleep(0 if url.endswith("a") else 0.01)
+        return httpx.Response(
+            200, text="<body>Openings</body>", request=httpx.Request("GET", url)
+        )
+
+    async def scan():
+        fetcher = AsyncStaticFetcher(timeout=5)
+        return await asyncio.gather(
+            fetcher.fetch("https://example.com/a"),
+            fetcher.fetch("https://example.com/b"),
+        )
+
+    with patch("httpx.AsyncClient.get", fake_get):
+        results = asyncio.run(scan())
+
+    assert [r.content for r in results] == ["Openings", "Openings"]
+    assert seen_clients[0] is not seen_clients[1]
+    assert all(client.is_closed for client in seen_clients)
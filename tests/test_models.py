@@ -1,9 +1,13 @@
 """Tests for database models."""
 
+import json
+import sqlite3
+
 import pytest
 from sqlmodel import Session, select
 
-from job.core import JobAd
+from job.core import JobAd, JobFitAssessment
+from job.core.context import get_engine, upgrade_schema
 
 
 def test_job_ad_creation(sample_job: JobAd):
@@ -67,3 +71,70 @@ def test_job_ad_unique_constraint(db_session: Session, sample_job: JobAd):
 
     with pytest.raises(Exception):  # SQLite raises IntegrityError
         db_session.commit()
+
+
+def test_fit_assessment_decodes_json_lists():
+    """Test that stored assessments expose their JSON columns as lists."""
+    assessment = JobFitAssessment(
+        job_id=1,
+        model_name="test",
+        context_file_paths=json.dumps(["/tmp/cv.toml"]),
+        overall_fit_score=75,
+        fit_summary="Good fit",
+        strengths=json.dumps(["Python"]),
+        gaps=json.dumps(["Go"]),
+        recommendations="",
+        key_insights="",
+    )
+
+    assert assessment.strengths_list == ["Python"]
+    assert assessment.gaps_list == ["Go"]
+    assert assessment.context_files_list == ["/tmp/cv.toml"]
+
+
+def test_engine_adds_columns_missing_from_older_database(tmp_path):
+    """Test that a database from an earlier release gains new nullable columns."""
+    db_path = tmp_path / "old.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE jobad (id INTEGER PRIMARY KEY, job_posting_url VARCHAR NOT NULL,"
+            " title VARCHAR NOT NULL, company VARCHAR NOT NULL,"
+            " location VARCHAR NOT NULL, deadline VARCHAR NOT NULL,"
+            " department VARCHAR NOT NULL, hiring_manager VARCHAR NOT NULL,"
+            " full_ad VARCHAR NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO jobad VALUES (1, 'https://example.com/1', 'Dev', 'Acme',"
+            " 'Remote', '', '', '', 'Ad')"
+        )
+
+    engine = get_engine(f"sqlite:///{db_path}")
+    with Session(engine) as session:
+        job = session.exec(select(JobAd)).one()
+
+    assert job.title == "Dev"
+    assert job.content_sha256 is None
+    assert job.etag is None
+    # Already upgraded: nothing left for job db migrate to add
+    assert upgrade_schema(engine) == ([], [])
+
+
+def test_upgrade_reports_missing_required_column(tmp_path):
+    """Test that a missing non-nullable column is reported and not stamped."""
+    db_path = tmp_path / "old.db"
+    with sqlite3.connect(db_path) as conn:
+        # No title column, which the model requires
+        conn.execute(
+            "CREATE TABLE jobad (id INTEGER PRIMARY KEY, job_posting_url VARCHAR NOT NULL,"
+            " company VARCHAR NOT NULL, location VARCHAR NOT NULL,"
+            " deadline VARCHAR NOT NULL, department VARCHAR NOT NULL,"
+            " hiring_manager VARCHAR NOT NULL, full_ad VARCHAR NOT NULL)"
+        )
+
+    engine = get_engine(f"sqlite:///{db_path}")
+    added, skipped = upgrade_schema(engine)
+
+    assert added == []
+    assert skipped == ["jobad.title"]
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA user_version").scalar_one() == 0
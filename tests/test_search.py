@@ -0,0 +1,79 @@
+"""Tests for career page keyword search."""
+
+import re
+from unittest.mock import Mock, patch
+
+from job.config import CareerPage
+from job.fetchers.base import MAX_CONTENT_CHARS
+from job.search import count_keywords, extract_context, scan_page, search_keywords
+
+
+def test_count_keywords_overlapping_and_prefix_keywords():
+    """Test that one pass counts keywords sharing or overlapping offsets."""
+    text = "Senior Python Developer. python3, big data engineer, Python"
+    counts = count_keywords(
+        text, ["python", "Python Developer", "big data", "data engineer"]
+    )
+
+    assert counts["python"] == 2
+    assert counts["python developer"] == 1
+    assert counts["big data"] == 1
+    assert counts["data engineer"] == 1
+
+
+def test_count_keywords_self_overlap_counts_like_findall():
+    """Test that a keyword overlapping itself is counted without overlaps."""
+    text = "go go go, Go Go"
+    counts = count_keywords(text, ["go go", "go"])
+
+    assert counts["go go"] == len(re.findall(r"\bgo go\b", text, re.IGNORECASE))
+    assert counts["go go"] == 2
+    assert counts["go"] == 5
+
+
+def test_search_keywords_sorted_with_context():
+    """Test that matches are sorted by count and carry snippets."""
+    text = "Rust engineer wanted.\nWe also hire a Go engineer and a Rust lead."
+    matches = search_keywords(text, ["rust", "engineer", "java"])
+
+    assert [m.keyword for m in matches] == ["rust", "engineer"]
+    assert matches[0].count == 2
+    assert "Rust engineer wanted" in matches[0].context_snippets[0]
+
+
+def test_extract_context_stays_on_line_and_merges_nearby_matches():
+    """Test that snippets keep to one line and absorb close repeat matches."""
+    text = "Careers\nPython developer, Python team\nOther python role"
+    snippets = extract_context(text, "python")
+
+    assert snippets == [
+        "...Python developer, Python team...",
+        "...Other python role...",
+    ]
+
+
+def test_search_keywords_reports_duplicates_once():
+    """Test that repeated keywords, in any case, give a single match."""
+    matches = search_keywords("Python role", ["python", "Python", "python"])
+
+    assert len(matches) == 1
+    assert matches[0].keyword == "python"
+
+
+def test_scan_page_searches_every_article_card(app_context):
+    """Test that listings built from <article> cards are searched in full."""
+    cards = "".join(
+        f"<article><h2>Job {i}: Sales engineer</h2><p>Apply now</p></article>"
+        for i in range(2000)
+    )
+    html = f"<html><body>{cards}<article>Rust developer</article></body></html>"
+    page = CareerPage(company="Acme", url="https://example.com/careers")
+
+    with patch("job.fetchers.static._SESSION.get") as mock_get:
+        mock_get.return_value = Mock(text=html, status_code=200, headers={})
+        result = scan_page(page, ["rust", "sales"], app_context, no_js=True)
+
+    assert result.success
+    assert result.content_length > MAX_CONTENT_CHARS
+    counts = {m.keyword: m.count for m in result.matches}
+    assert counts == {"sales": 2000, "rust": 1}